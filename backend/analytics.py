@@ -0,0 +1,214 @@
+"""
+Growth analytics over an account's recorded balances.
+
+Each account's ValueRecord series is resampled to month-end balances and
+decomposed into deposits (past FutureContribution rows) and returns (whatever
+growth the deposits don't explain). All per-account maths is done with NumPy
+over whole arrays; results are cached per account and dropped by the write
+handlers whenever that account's values or contributions change.
+"""
+
+import datetime
+import threading
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .models import FutureContribution
+from .schemas import from_pence
+
+# Number of month-over-month deltas averaged in `rolling_delta`.
+ROLLING_WINDOW = 3
+
+
+def month_key(d: datetime.date) -> int:
+    """Months since year 0, so consecutive months differ by one."""
+    return d.year * 12 + d.month - 1
+
+
+def month_label(key: int) -> str:
+    """Format a `month_key` as YYYY-MM."""
+    return f"{key // 12:04d}-{key % 12 + 1:02d}"
+
+
+def _add_months(d: datetime.date, n: int) -> datetime.date:
+    key = month_key(d) + n
+    return datetime.date(key // 12, key % 12 + 1, min(d.day, 28))
+
+
+def deposit_events(
+    contributions: Sequence[FutureContribution], as_of: datetime.date
+) -> List[Tuple[datetime.date, int]]:
+    """Expand contributions into dated deposits (pence) that happened on or before `as_of`.
+
+    One-offs count on their date; recurring rows count once a month from their
+    start date. Undated rows have no place on the timeline and are ignored.
+    """
+    events: List[Tuple[datetime.date, int]] = []
+    for c in contributions:
+        if c.date is None or c.date > as_of:
+            continue
+        if not c.recurring:
+            events.append((c.date, c.amount_pence))
+            continue
+        n = month_key(as_of) - month_key(c.date) + 1
+        for i in range(n):
+            d = c.date if i == 0 else _add_months(c.date, i)
+            if d <= as_of:
+                events.append((d, c.amount_pence))
+    return events
+
+
+def xirr(flows: np.ndarray, years: np.ndarray, guess: float = 0.1) -> Optional[float]:
+    """Annual rate r with sum(flows * (1 + r) ** -years) == 0, by Newton's method.
+
+    Returns None when the flows don't change sign or the iteration diverges.
+    """
+    if not (flows.min() < 0 < flows.max()):
+        return None
+    r = guess
+    for _ in range(100):
+        base = 1.0 + r
+        if base <= 0:
+            return None
+        disc = base ** -years
+        f = float(np.dot(flows, disc))
+        df = float(np.dot(-years * flows, disc / base))
+        if df == 0:
+            return None
+        step = f / df
+        r -= step
+        if abs(step) < 1e-10:
+            return r
+    return None
+
+
+def analyse_account(
+    dates: Sequence[datetime.date],
+    values_pence: Sequence[int],
+    deposits: Sequence[Tuple[datetime.date, int]],
+) -> Dict:
+    """Compute the growth breakdown for one account's date-sorted balance series.
+
+    A deposit is attributed to the first month-end observation on or after
+    its date. Deposits on or before the opening observation are treated as
+    part of the opening balance, and deposits after the last observation
+    don't show up in any balance yet, so both are left out (of XIRR too).
+    """
+    if not dates:
+        return {
+            "start_date": None,
+            "end_date": None,
+            "start_value": 0.0,
+            "end_value": 0.0,
+            "growth": 0.0,
+            "contributions": 0.0,
+            "returns": 0.0,
+            "cagr": None,
+            "xirr": None,
+            "months": [],
+        }
+
+    ordinals = np.fromiter((d.toordinal() for d in dates), dtype=np.int64, count=len(dates))
+    months = np.fromiter((month_key(d) for d in dates), dtype=np.int64, count=len(dates))
+    pence = np.asarray(values_pence, dtype=np.int64)
+
+    # last observation in each calendar month (input is date-sorted)
+    last = np.flatnonzero(np.append(months[1:] != months[:-1], True))
+    mk, mv = months[last], pence[last]
+
+    delta = np.zeros(len(mk), dtype=np.int64)
+    delta[1:] = np.diff(mv)
+
+    # the opening balance is the first month's closing observation
+    t0 = ordinals[last[0]]
+
+    per_month = np.zeros(len(mk), dtype=np.int64)
+    dep_ord = np.empty(0, dtype=np.int64)
+    dep_amt = np.empty(0, dtype=np.int64)
+    if deposits:
+        dep_ord = np.fromiter((d.toordinal() for d, _ in deposits), dtype=np.int64, count=len(deposits))
+        dep_amt = np.fromiter((a for _, a in deposits), dtype=np.int64, count=len(deposits))
+        slot = np.searchsorted(ordinals[last], dep_ord, side="left")
+        keep = (dep_ord > t0) & (slot < len(mk))
+        per_month = np.bincount(slot[keep], weights=dep_amt[keep], minlength=len(mk)).astype(np.int64)
+    returns = delta - per_month
+
+    rolling = np.full(len(mk), np.nan)
+    if len(mk) > ROLLING_WINDOW:
+        kernel = np.ones(ROLLING_WINDOW) / ROLLING_WINDOW
+        rolling[ROLLING_WINDOW:] = np.convolve(delta[1:], kernel, mode="valid")
+
+    start, end = int(mv[0]), int(mv[-1])
+    span_years = (ordinals[-1] - t0) / 365.25
+    cagr = None
+    if span_years > 0 and start > 0 and end > 0:
+        cagr = (end / start) ** (1 / span_years) - 1
+
+    # money-weighted return: opening balance and deposits in, closing balance out
+    irr = None
+    if span_years > 0:
+        inside = (dep_ord > t0) & (dep_ord <= ordinals[-1])
+        flows = np.concatenate(([-start], -dep_amt[inside], [end])).astype(float)
+        when = np.concatenate(([t0], dep_ord[inside], [ordinals[-1]]))
+        irr = xirr(flows, (when - t0) / 365.25)
+
+    contributed = int(per_month[1:].sum())
+    return {
+        "start_date": dates[last[0]],
+        "end_date": dates[-1],
+        "start_value": from_pence(start),
+        "end_value": from_pence(end),
+        "growth": from_pence(end - start),
+        "contributions": from_pence(contributed),
+        "returns": from_pence(end - start - contributed),
+        "cagr": cagr,
+        "xirr": irr,
+        "months": [
+            {
+                "month": month_label(int(k)),
+                "value": from_pence(int(v)),
+                "delta": from_pence(int(d)),
+                "contributions": from_pence(int(c)),
+                "returns": from_pence(int(r)),
+                "rolling_delta": None if np.isnan(a) else round(float(a) / 100, 2),
+            }
+            for k, v, d, c, r, a in zip(mk, mv, delta, per_month, returns, rolling)
+        ],
+    }
+
+
+class AnalyticsCache:
+    """Per-account analytics results.
+
+    Each entry is stored with a stamp (the day it was computed on plus the data
+    source); a lookup with a different stamp is a miss.
+    """
+
+    def __init__(self):
+        self._entries: Dict[int, Tuple[Hashable, Dict]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, account_id: int, stamp: Hashable) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(account_id)
+        if entry and entry[0] == stamp:
+            return entry[1]
+        return None
+
+    def put(self, account_id: int, stamp: Hashable, result: Dict) -> None:
+        with self._lock:
+            self._entries[account_id] = (stamp, result)
+
+    def invalidate(self, account_id: Optional[int]) -> None:
+        if account_id is None:
+            return
+        with self._lock:
+            self._entries.pop(account_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+cache = AnalyticsCache()
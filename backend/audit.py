@@ -0,0 +1,294 @@
+"""
+Append-only audit log of every database mutation, with point-in-time replay.
+
+Every ORM insert, update and delete is captured from SQLAlchemy session
+events. That covers the routers, the recurring-contribution upsert, cascade
+deletes, settings and FX imports without each handler having to remember to
+log. Events are only written once their transaction commits.
+
+File format: an 8-byte magic header, then one frame per event:
+
+    uint32 length | uint32 crc32 | payload (compact JSON, `length` bytes)
+
+with the payload {"ts": <unix µs>, "op": "i"|"u"|"d", "t": <table>, "r": <row>}.
+Inserts and updates carry the full row; deletes carry just the id. A torn
+frame at the end of the file (crash mid-write) fails its CRC; it marks the end
+of the log for readers and is cut off when the log is next opened.
+
+Events are buffered in memory and appended in batches. The file is fsynced at
+most once per FSYNC_INTERVAL rather than once per event, so a power cut can
+lose up to that much history (never the database itself).
+
+When the log is first enabled it starts with a baseline: one insert event per
+existing row. Replaying into an empty database therefore reproduces any point
+in time from then on:
+
+    python -m backend.audit replay data/budget.audit restored.db --until 2026-10-19T09:30
+    python -m backend.audit dump data/budget.audit
+
+Enabled by setting BUDGET_AUDIT_LOG to the log file path.
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import struct
+import sys
+import threading
+import time
+import zlib
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import Date, event
+from sqlalchemy.orm import Session as OrmSession
+from sqlmodel import Session, SQLModel, create_engine
+
+from . import models  # noqa: F401 — registers tables on SQLModel.metadata
+
+MAGIC = b"BUDGETA1"
+_FRAME = struct.Struct(">II")
+
+# Buffered events are written out once this many are pending...
+BATCH_SIZE = 64
+# ...or by the periodic flush, which also fsyncs at most this often (seconds).
+FLUSH_INTERVAL = 1.0
+FSYNC_INTERVAL = 1.0
+
+
+def _encode(value):
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    return value
+
+
+def _row(obj) -> Dict:
+    return {c.name: _encode(getattr(obj, c.key)) for c in obj.__table__.columns}
+
+
+def _frame(ts: int, op: str, table: str, row: Dict) -> bytes:
+    payload = json.dumps({"ts": ts, "op": op, "t": table, "r": row}, separators=(",", ":")).encode()
+    return _FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def _check_magic(fh, path: str) -> None:
+    if fh.read(len(MAGIC)) != MAGIC:
+        raise ValueError(f"{path} is not an audit log")
+
+
+def _iter_frames(fh) -> Iterator[bytes]:
+    """Yield frame payloads from `fh` (positioned after the magic), stopping at a torn tail."""
+    while True:
+        header = fh.read(_FRAME.size)
+        if len(header) < _FRAME.size:
+            return
+        length, crc = _FRAME.unpack(header)
+        payload = fh.read(length)
+        if len(payload) < length or zlib.crc32(payload) != crc:
+            return
+        yield payload
+
+
+class AuditLog:
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self._buffer: List[bytes] = []
+        self._lock = threading.Lock()
+        self._fh = None
+        self._last_fsync = 0.0
+        self._unsynced = False
+
+    @property
+    def enabled(self) -> bool:
+        return self._fh is not None
+
+    def open(self, session: Session) -> None:
+        """Open the log for appending, writing the header and baseline if it is new."""
+        if not self.path or self._fh is not None:
+            return
+        new = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        if not new:
+            # cut off a torn frame left by a crash so new events follow valid ones
+            with open(self.path, "r+b") as fh:
+                _check_magic(fh, self.path)
+                end = fh.tell()
+                for _ in _iter_frames(fh):
+                    end = fh.tell()
+                fh.truncate(end)
+        self._fh = open(self.path, "ab")
+        if new:
+            self._fh.write(MAGIC)
+            ts = time.time_ns() // 1000
+            for table in SQLModel.metadata.sorted_tables:
+                for row in session.connection().execute(table.select()).mappings():
+                    self._buffer.append(_frame(ts, "i", table.name, {k: _encode(v) for k, v in row.items()}))
+            self.flush(force_sync=True)
+
+    def append(self, events: List[Tuple[str, str, Dict]]) -> None:
+        """Buffer one transaction's (op, table, row) events.
+
+        The timestamp is taken under the lock, so timestamps never go
+        backwards in file order even when commits race.
+        """
+        with self._lock:
+            ts = time.time_ns() // 1000
+            self._buffer.extend(_frame(ts, op, table, row) for op, table, row in events)
+            pending = len(self._buffer)
+        if pending >= BATCH_SIZE:
+            self.flush()
+
+    def flush(self, force_sync: bool = False) -> None:
+        """Write buffered frames in one go; fsync if FSYNC_INTERVAL has passed (or forced)."""
+        with self._lock:
+            if self._fh is None:
+                self._buffer.clear()
+                return
+            if self._buffer:
+                self._fh.write(b"".join(self._buffer))
+                self._fh.flush()
+                self._buffer.clear()
+                self._unsynced = True
+            now = time.monotonic()
+            if self._unsynced and (force_sync or now - self._last_fsync >= FSYNC_INTERVAL):
+                os.fsync(self._fh.fileno())
+                self._last_fsync = now
+                self._unsynced = False
+
+    def close(self) -> None:
+        self.flush(force_sync=True)
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+    async def run(self) -> None:
+        """Flush forever, every FLUSH_INTERVAL seconds."""
+        while True:
+            await asyncio.sleep(FLUSH_INTERVAL)
+            await asyncio.to_thread(self.flush)
+
+
+log = AuditLog(os.getenv("BUDGET_AUDIT_LOG") or None)
+
+
+# ---------------------------------------------------------------------------
+# Capture: collect row images at flush, hand them to the log on commit.
+# ---------------------------------------------------------------------------
+
+@event.listens_for(OrmSession, "after_flush")
+def _collect(session, flush_context):
+    if not log.enabled:
+        return
+    pending = session.info.setdefault("audit_pending", [])
+    for obj in session.new:
+        pending.append(("i", obj.__tablename__, _row(obj)))
+    for obj in session.dirty:
+        if session.is_modified(obj, include_collections=False):
+            pending.append(("u", obj.__tablename__, _row(obj)))
+    for obj in session.deleted:
+        pending.append(("d", obj.__tablename__, {"id": obj.id}))
+
+
+@event.listens_for(OrmSession, "after_commit")
+def _commit(session):
+    pending = session.info.pop("audit_pending", None)
+    if pending and log.enabled:
+        log.append(pending)
+
+
+@event.listens_for(OrmSession, "after_rollback")
+def _rollback(session):
+    session.info.pop("audit_pending", None)
+
+
+# ---------------------------------------------------------------------------
+# Reading and replay
+# ---------------------------------------------------------------------------
+
+def iter_events(path: str) -> Iterator[Dict]:
+    """Stream events from a log file one frame at a time."""
+    with open(path, "rb") as fh:
+        _check_magic(fh, path)
+        for payload in _iter_frames(fh):
+            yield json.loads(payload)
+
+
+def _decode_row(table, row: Dict) -> Dict:
+    out = {}
+    for name, value in row.items():
+        col = table.c.get(name)
+        if col is None:
+            continue  # column no longer exists
+        if value is not None and isinstance(col.type, Date):
+            value = datetime.date.fromisoformat(value)
+        out[name] = value
+    return out
+
+
+def replay(path: str, engine, until: Optional[datetime.datetime] = None, batch: int = 1000) -> int:
+    """Apply events from `path` to the (empty) database behind `engine`, up to `until`.
+
+    Returns the number of events applied. Commits every `batch` events so memory
+    stays flat however long the log is. The whole file is always read, since
+    events after `until` are skipped rather than ending the replay.
+    """
+    SQLModel.metadata.create_all(engine)
+    limit = None if until is None else int(until.timestamp() * 1_000_000)
+    applied = 0
+    with engine.connect() as conn:
+        tx = conn.begin()
+        try:
+            for ev in iter_events(path):
+                if limit is not None and ev["ts"] > limit:
+                    # not `break`: a wall-clock step back (or a log written before
+                    # append stamped under its lock) can put earlier events after this
+                    continue
+                table = SQLModel.metadata.tables.get(ev["t"])
+                if table is None:
+                    continue
+                row = _decode_row(table, ev["r"])
+                if ev["op"] == "i":
+                    conn.execute(table.insert().values(**row))
+                elif ev["op"] == "u":
+                    conn.execute(table.update().where(table.c.id == row["id"]).values(**row))
+                elif ev["op"] == "d":
+                    conn.execute(table.delete().where(table.c.id == row["id"]))
+                applied += 1
+                if applied % batch == 0:
+                    tx.commit()
+                    tx = conn.begin()
+            tx.commit()
+        except Exception:
+            tx.rollback()
+            raise
+    return applied
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Inspect or replay a budget audit log.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_dump = sub.add_parser("dump", help="print events as JSON lines")
+    p_dump.add_argument("log")
+    p_replay = sub.add_parser("replay", help="rebuild a database from the log")
+    p_replay.add_argument("log")
+    p_replay.add_argument("db", help="path of the new SQLite file (must not exist)")
+    p_replay.add_argument("--until", help="local ISO timestamp; events after it are skipped")
+    args = parser.parse_args(argv)
+
+    if args.command == "dump":
+        for ev in iter_events(args.log):
+            print(json.dumps(ev))
+        return 0
+
+    if os.path.exists(args.db):
+        print(f"{args.db} already exists; replay needs a fresh file", file=sys.stderr)
+        return 1
+    until = datetime.datetime.fromisoformat(args.until) if args.until else None
+    count = replay(args.log, create_engine(f"sqlite:///{args.db}"), until)
+    print(f"replayed {count} events into {args.db}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
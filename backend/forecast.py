@@ -0,0 +1,138 @@
+"""
+What-if sensitivity surface for the Forecast page.
+
+The projection mirrors Forecast.tsx: starting from the /summary total, each
+month (the current month first) adds every recurring contribution plus any
+one-offs dated in that month. The surface answers "what if account A paid
+`delta` more (or less) per month?" for a grid of deltas per account, giving
+the balance at each horizon and the first month the target is reached.
+
+Because the projection is linear in the monthly rate, the whole surface is a
+single broadcast: baseline path (months) + clamped delta (accounts x deltas) x
+month number. An account's rate can't drop below zero, so negative deltas are
+clamped at -rate for that account.
+
+Surfaces are cached per (grid, starting total, target, month) and the cache
+is cleared whenever contributions change.
+"""
+
+import datetime
+import threading
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .analytics import month_key, month_label
+from .schemas import from_pence
+
+
+def build_surface(
+    start_total_pence: int,
+    target_pence: Optional[int],
+    account_rates_pence: Dict[int, int],
+    unallocated_rate_pence: int,
+    one_offs: Sequence[Tuple[datetime.date, int]],
+    deltas_pence: Sequence[int],
+    horizons: Sequence[int],
+    today: datetime.date,
+) -> Dict:
+    """Compute balances and target-hit months for every (account, delta, horizon).
+
+    `account_rates_pence` maps account id to its recurring monthly amount;
+    `one_offs` are (date, amount) pairs, of which only those falling inside
+    the projection window count. Money in and out is integer pence.
+    """
+    n_months = max(horizons)
+    start = month_key(today)
+    month_no = np.arange(1, n_months + 1, dtype=np.int64)
+
+    one_off = np.zeros(n_months, dtype=np.int64)
+    if one_offs:
+        offset = np.fromiter((month_key(d) - start for d, _ in one_offs), dtype=np.int64, count=len(one_offs))
+        amount = np.fromiter((a for _, a in one_offs), dtype=np.int64, count=len(one_offs))
+        inside = (offset >= 0) & (offset < n_months)
+        np.add.at(one_off, offset[inside], amount[inside])
+
+    ids = list(account_rates_pence)
+    rates = np.fromiter((account_rates_pence[i] for i in ids), dtype=np.int64, count=len(ids))
+    total_rate = int(rates.sum()) + unallocated_rate_pence
+    baseline = start_total_pence + total_rate * month_no + np.cumsum(one_off)
+
+    deltas = np.asarray(deltas_pence, dtype=np.int64)
+    effective = np.maximum(deltas[None, :], -rates[:, None])  # (accounts, deltas)
+    paths = baseline[None, None, :] + effective[:, :, None] * month_no[None, None, :]  # (accounts, deltas, months)
+
+    at = np.asarray(horizons, dtype=np.int64) - 1
+    balances = paths[:, :, at]
+
+    def hit_months(p: np.ndarray) -> np.ndarray:
+        """Months until the target is first reached along the last axis, or -1."""
+        if target_pence is None:
+            return np.full(p.shape[:-1], -1)
+        if start_total_pence >= target_pence:
+            return np.zeros(p.shape[:-1], dtype=np.int64)
+        reached = p >= target_pence
+        return np.where(reached.any(axis=-1), reached.argmax(axis=-1) + 1, -1)
+
+    hits = hit_months(paths)
+    base_hit = int(hit_months(baseline))
+
+    def to_month(n: int) -> Optional[str]:
+        return None if n < 0 else month_label(start + max(n - 1, 0))
+
+    return {
+        "start_month": month_label(start),
+        "start_total": from_pence(start_total_pence),
+        "target": None if target_pence is None else from_pence(target_pence),
+        "horizons": list(horizons),
+        "deltas": [from_pence(int(d)) for d in deltas],
+        "baseline": {
+            "monthly_rate": from_pence(total_rate),
+            "balances": [from_pence(int(b)) for b in baseline[at]],
+            "months_to_target": None if base_hit < 0 else base_hit,
+            "target_month": to_month(base_hit),
+        },
+        "accounts": [
+            {
+                "id": acct_id,
+                "monthly_rate": from_pence(int(rates[i])),
+                # balances[d][h]: balance at horizons[h] with deltas[d] applied
+                "balances": (balances[i] / 100).tolist(),
+                "months_to_target": [None if n < 0 else int(n) for n in hits[i]],
+                "target_month": [to_month(int(n)) for n in hits[i]],
+            }
+            for i, acct_id in enumerate(ids)
+        ],
+    }
+
+
+class SurfaceCache:
+    """Computed surfaces keyed by everything they depend on apart from contributions."""
+
+    # small bound so arbitrary query grids can't grow the cache without limit
+    MAX_ENTRIES = 32
+
+    def __init__(self):
+        self._entries: Dict[Hashable, Dict] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Dict]:
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key: Hashable, surface: Dict) -> None:
+        with self._lock:
+            if len(self._entries) >= self.MAX_ENTRIES:
+                self._entries.clear()
+            self._entries[key] = surface
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+cache = SurfaceCache()
+
+
+def default_deltas(step_pence: int, steps: int) -> List[int]:
+    return [step_pence * i for i in range(-steps, steps + 1)]
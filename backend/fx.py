@@ -0,0 +1,132 @@
+"""
+Currency conversion from a locally stored FX rate table.
+
+Rates live in the FxRate table and are imported from CSV files, so nothing
+ever needs the network:
+
+    date,currency,rate
+    2026-01-31,USD,0.79
+    2026-01-31,EUR,0.86
+
+`rate` is the value of one unit of `currency` in the base currency
+(BUDGET_BASE_CURRENCY, default GBP). A conversion on a given date uses the
+latest rate on or before that date, falling back to the earliest known rate
+for dates before it.
+
+Lookups never touch the database: `rates` keeps one sorted array of dates and
+one of rates per currency and bisects them. It is loaded at startup and
+reloaded after every import through the API (a CLI import is picked up on
+the next restart).
+
+Import from the command line with:
+
+    python -m backend.fx rates.csv
+"""
+
+import bisect
+import csv
+import datetime
+import io
+import os
+import sys
+import threading
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlmodel import Session, select
+
+from .models import FxRate
+
+BASE_CURRENCY = os.getenv("BUDGET_BASE_CURRENCY", "GBP").upper()
+
+
+class RateTable:
+    """In-memory, date-indexed FX rates: per currency, parallel sorted arrays."""
+
+    def __init__(self):
+        self._series: Dict[str, Tuple[array, array]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, session: Session) -> None:
+        """(Re)read every rate from the database. Called at startup and after imports."""
+        series: Dict[str, Tuple[array, array]] = {}
+        for r in session.exec(select(FxRate).order_by(FxRate.currency, FxRate.date)):
+            days, values = series.setdefault(r.currency, (array("l"), array("d")))
+            days.append(r.date.toordinal())
+            values.append(r.rate)
+        with self._lock:
+            self._series = series
+
+    def rate(self, currency: str, on: datetime.date) -> Optional[float]:
+        """Base-currency value of one unit of `currency` on `on`, or None if unknown."""
+        currency = currency.upper()
+        if currency == BASE_CURRENCY:
+            return 1.0
+        entry = self._series.get(currency)
+        if not entry:
+            return None
+        days, values = entry
+        i = bisect.bisect_right(days, on.toordinal()) - 1
+        return values[max(i, 0)]
+
+    def convert(self, pence: int, currency: str, on: datetime.date) -> Optional[int]:
+        """Convert minor units of `currency` into base-currency minor units."""
+        rate = self.rate(currency, on)
+        return None if rate is None else round(pence * rate)
+
+
+rates = RateTable()
+
+
+def parse_csv(text: str) -> List[Tuple[datetime.date, str, float]]:
+    """Parse `date,currency,rate` rows (header required). Raises ValueError on bad input."""
+    reader = csv.DictReader(io.StringIO(text))
+    if not reader.fieldnames or not {"date", "currency", "rate"} <= set(reader.fieldnames):
+        raise ValueError("CSV must have a header with date, currency and rate columns")
+    rows = []
+    for line, row in enumerate(reader, start=2):
+        try:
+            rate = float(row["rate"])
+            rows.append((datetime.date.fromisoformat(row["date"].strip()), row["currency"].strip().upper(), rate))
+        except (AttributeError, TypeError, ValueError) as e:
+            raise ValueError(f"line {line}: {e}") from None
+        if rate <= 0:
+            raise ValueError(f"line {line}: rate must be positive")
+    return rows
+
+
+def import_rates(session: Session, rows: Iterable[Tuple[datetime.date, str, float]]) -> int:
+    """Insert or replace rates keyed on (currency, date). Returns the number of rows written."""
+    existing = {(r.currency, r.date): r for r in session.exec(select(FxRate))}
+    count = 0
+    for on, currency, rate in rows:
+        record = existing.get((currency, on))
+        if record:
+            record.rate = rate
+        else:
+            record = FxRate(currency=currency, date=on, rate=rate)
+            existing[(currency, on)] = record
+        session.add(record)
+        count += 1
+    session.commit()
+    rates.load(session)
+    return count
+
+
+def main(argv=None) -> int:
+    from .db import create_db_and_tables, engine
+
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1:
+        print("usage: python -m backend.fx rates.csv", file=sys.stderr)
+        return 2
+    with open(argv[0], encoding="utf-8") as fh:
+        rows = parse_csv(fh.read())
+    create_db_and_tables()
+    with Session(engine) as session:
+        print(f"imported {import_rates(session, rows)} rates")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,18 +1,52 @@
+import asyncio
+import contextlib
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlmodel import Session
 
+from . import db
+from .analytics import cache as analytics_cache
+from .audit import log as audit_log
 from .db import create_db_and_tables
+from .forecast import cache as forecast_cache
+from .fx import rates as fx_rates
+from .maintenance import scheduler as maintenance_scheduler
+from .profiling import ProfilingMiddleware
+from .readmodel import read_model
 from .seed import seed
-from .routers import accounts, contributions, summary, values
+from .snapshot import snapshot
+from .routers import (
+    accounts, analytics, contributions, debug, forecast, fx, maintenance, snapshot as snapshot_router, summary, values,
+)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     create_db_and_tables()
+    with Session(db.engine) as session:
+        audit_log.open(session)
     seed()
+    analytics_cache.clear()
+    forecast_cache.clear()
+    with Session(db.engine) as session:
+        fx_rates.load(session)
+        if read_model.enabled:
+            read_model.load(session)
+    tasks = []
+    if snapshot.path and snapshot.interval > 0:
+        tasks.append(asyncio.create_task(snapshot.run()))
+    if audit_log.enabled:
+        tasks.append(asyncio.create_task(audit_log.run()))
+    if maintenance_scheduler.enabled:
+        tasks.append(asyncio.create_task(maintenance_scheduler.run()))
     yield
+    for task in tasks:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    audit_log.close()
 
 
 app = FastAPI(title="Budget App API", lifespan=lifespan)
@@ -23,9 +57,19 @@ app.add_middleware(
     allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
+    # let the dashboard read snapshot staleness and profile ids cross-origin
+    expose_headers=["X-Snapshot-Age", "X-Profile-Id"],
 )
+# Pass-through unless BUDGET_PROFILING=1 and the request asks for a profile
+app.add_middleware(ProfilingMiddleware)
 
 app.include_router(accounts.router)
 app.include_router(values.router)
 app.include_router(contributions.router)
 app.include_router(summary.router)
+app.include_router(analytics.router)
+app.include_router(fx.router)
+app.include_router(forecast.router)
+app.include_router(snapshot_router.router)
+app.include_router(maintenance.router)
+app.include_router(debug.router)
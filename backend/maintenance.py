@@ -0,0 +1,223 @@
+"""
+Nightly database maintenance and cache pre-warming.
+
+Deletes and the recurring-contribution upsert (which deletes and re-inserts
+rows) leave free pages behind in budget.db. Over time the planner's
+statistics also drift from the data. Once a night, during quiet hours, the
+scheduler runs these jobs in order:
+
+    analyze     ANALYZE + PRAGMA optimize
+    vacuum      PRAGMA incremental_vacuum. The first run switches the file to
+                auto_vacuum=INCREMENTAL, which needs one full VACUUM.
+    checkpoint  PRAGMA wal_checkpoint(TRUNCATE); skipped unless in WAL mode
+    snapshot    refresh the read-only snapshot, if one is configured
+    prewarm     fill the analytics cache and the default forecast surface
+
+Each job records its status (ok / skipped / error), duration and a small
+detail dict. GET /maintenance reports them.
+
+Run the database jobs once by hand (the cache jobs only matter in the
+running server) with:
+
+    python -m backend.maintenance [job ...]
+
+Configuration (environment):
+    BUDGET_MAINTENANCE_AT  local time "HH:MM" to run at each night; unset disables the scheduler.
+                           Pick a time after midnight: cached results are stamped with the day.
+"""
+
+import asyncio
+import datetime
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from sqlmodel import Session
+
+from . import db, snapshot
+
+logger = logging.getLogger(__name__)
+
+
+class JobSkipped(Exception):
+    """Raised by a job that has nothing to do; the message says why."""
+
+
+def _autocommit():
+    # VACUUM and the auto_vacuum switch can't run inside a transaction
+    return db.engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+
+
+def analyze() -> Dict:
+    with _autocommit() as conn:
+        conn.exec_driver_sql("ANALYZE")
+        conn.exec_driver_sql("PRAGMA optimize")
+    return {}
+
+
+def vacuum() -> Dict:
+    with _autocommit() as conn:
+        free_before = conn.exec_driver_sql("PRAGMA freelist_count").scalar()
+        mode = conn.exec_driver_sql("PRAGMA auto_vacuum").scalar()
+        if mode != 2:
+            # one-off conversion; later runs only release the free pages
+            conn.exec_driver_sql("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.exec_driver_sql("VACUUM")
+        else:
+            # sqlite3's execute() steps a statement only once, freeing a single
+            # page here; executescript() runs it to completion
+            conn.connection.executescript("PRAGMA incremental_vacuum")
+        free_after = conn.exec_driver_sql("PRAGMA freelist_count").scalar()
+    return {"full_vacuum": mode != 2, "pages_freed": free_before - free_after}
+
+
+def checkpoint() -> Dict:
+    with _autocommit() as conn:
+        journal = conn.exec_driver_sql("PRAGMA journal_mode").scalar()
+        if journal.lower() != "wal":
+            raise JobSkipped(f"journal_mode is {journal}")
+        busy, log_frames, checkpointed = conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)").one()
+    return {"busy": bool(busy), "log_frames": log_frames, "checkpointed": checkpointed}
+
+
+def refresh_snapshot() -> Dict:
+    snap = snapshot.snapshot
+    if not (snap.path and snap.interval > 0):
+        raise JobSkipped("no snapshot configured")
+    snap.refresh()
+    return {"generation": snap.generation}
+
+
+def prewarm() -> Dict:
+    from .routers.analytics import list_analytics
+    from .routers.forecast import DEFAULT_HORIZONS, DEFAULT_STEP, DEFAULT_STEPS, sensitivity
+
+    # The in-memory FX rates and read model are deliberately not reloaded here:
+    # the write handlers keep them current, and a reload racing those writes
+    # could drop or duplicate a record.
+    with Session(db.engine) as session:
+        sensitivity(step=DEFAULT_STEP, steps=DEFAULT_STEPS, horizons=list(DEFAULT_HORIZONS), session=session)
+    snap = snapshot.snapshot
+    # warm whichever database /analytics reads from, since cache entries are stamped with it
+    read = snap.session() if snap.enabled and snap.ready else Session(db.engine)
+    with read:
+        accounts = len(list_analytics(read)["accounts"])
+    return {"accounts": accounts}
+
+
+class Job:
+    def __init__(self, name: str, fn: Callable[[], Dict]):
+        self.name = name
+        self.fn = fn
+        self.status: Optional[str] = None  # ok / skipped / error; None until first run
+        self.started_at: Optional[datetime.datetime] = None
+        self.duration_ms: Optional[float] = None
+        self.detail: Dict = {}
+
+    def run(self) -> None:
+        self.started_at = datetime.datetime.now(datetime.timezone.utc)
+        start = time.perf_counter()
+        try:
+            self.detail = self.fn()
+            self.status = "ok"
+        except JobSkipped as e:
+            self.detail = {"reason": str(e)}
+            self.status = "skipped"
+        except Exception as e:
+            logger.exception("Maintenance job %s failed", self.name)
+            self.detail = {"error": f"{type(e).__name__}: {e}"}
+            self.status = "error"
+        self.duration_ms = round((time.perf_counter() - start) * 1000, 1)
+        logger.info("Maintenance job %s: %s in %.1f ms %s", self.name, self.status, self.duration_ms, self.detail)
+
+    def status_dict(self) -> Dict:
+        return {
+            "name": self.name,
+            "status": self.status,
+            "started_at": self.started_at,
+            "duration_ms": self.duration_ms,
+            "detail": self.detail,
+        }
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime.time]:
+    if not value:
+        return None
+    try:
+        return datetime.time.fromisoformat(value)
+    except ValueError:
+        logger.error("Ignoring BUDGET_MAINTENANCE_AT=%r; expected HH:MM", value)
+        return None
+
+
+class Scheduler:
+    def __init__(self, at: Optional[datetime.time]):
+        self.at = at
+        self.jobs: List[Job] = [
+            Job("analyze", analyze),
+            Job("vacuum", vacuum),
+            Job("checkpoint", checkpoint),
+            Job("snapshot", refresh_snapshot),
+            Job("prewarm", prewarm),
+        ]
+        self.next_run: Optional[datetime.datetime] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.at is not None
+
+    def next_after(self, now: datetime.datetime) -> datetime.datetime:
+        """The first scheduled time strictly after `now` (naive local time)."""
+        run = datetime.datetime.combine(now.date(), self.at)
+        return run if run > now else run + datetime.timedelta(days=1)
+
+    def run_all(self, names: Optional[List[str]] = None) -> List[Dict]:
+        """Run every job (or just `names`) in order. A failed job doesn't stop the ones after it."""
+        jobs = [job for job in self.jobs if names is None or job.name in names]
+        with self._lock:
+            for job in jobs:
+                job.run()
+            return [job.status_dict() for job in jobs]
+
+    def status(self) -> Dict:
+        return {
+            "enabled": self.enabled,
+            "at": self.at.strftime("%H:%M") if self.at else None,
+            "next_run": self.next_run,
+            "jobs": [job.status_dict() for job in self.jobs],
+        }
+
+    async def run(self) -> None:
+        """Sleep until the next scheduled time, run the jobs, repeat."""
+        while True:
+            self.next_run = self.next_after(datetime.datetime.now())
+            await asyncio.sleep((self.next_run - datetime.datetime.now()).total_seconds())
+            await asyncio.to_thread(self.run_all)
+
+
+scheduler = Scheduler(_parse_time(os.getenv("BUDGET_MAINTENANCE_AT")))
+
+
+DB_JOBS = ["analyze", "vacuum", "checkpoint"]
+
+
+def main(argv=None) -> int:
+    from .db import create_db_and_tables
+
+    names = (sys.argv[1:] if argv is None else argv) or DB_JOBS
+    unknown = set(names) - {job.name for job in scheduler.jobs}
+    if unknown:
+        print(f"unknown job(s): {', '.join(sorted(unknown))}", file=sys.stderr)
+        return 2
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    create_db_and_tables()
+    results = scheduler.run_all(names)
+    return 1 if any(r["status"] == "error" for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
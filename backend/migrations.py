@@ -0,0 +1,125 @@
+"""
+In-place schema upgrades for existing budget.db files.
+
+Older databases store money as REAL pounds, FutureContribution.date as a
+free-form string and have no Account.currency. The current models store
+integer pence, a DATE column and a currency code (existing accounts: GBP).
+`upgrade()` detects the legacy layout by inspecting column names and rebuilds
+the affected tables (SQLite cannot ALTER a column's type) inside a single
+transaction, so it is safe to run on every startup.
+
+It can also be run by hand against a copy of a production database:
+
+    python -m backend.migrations data/budget.db
+"""
+
+import argparse
+import shutil
+import sys
+from typing import Callable, List, Tuple
+
+from sqlalchemy.engine import Connection, Engine
+from sqlmodel import SQLModel, create_engine
+
+from . import models  # noqa: F401 — registers tables on SQLModel.metadata
+
+
+def _columns(conn: Connection, table: str) -> List[str]:
+    return [row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info({table})")]
+
+
+def _rebuild(conn: Connection, table: str, copy_select: str) -> None:
+    """Recreate `table` from the current model and copy rows across with `copy_select`.
+
+    `copy_select` reads from `_legacy_<table>` and must yield the new table's
+    columns in declaration order.
+    """
+    legacy = f"_legacy_{table}"
+    conn.exec_driver_sql(f"ALTER TABLE {table} RENAME TO {legacy}")
+    new_table = SQLModel.metadata.tables[table]
+    new_table.create(conn)
+    cols = ", ".join(c.name for c in new_table.columns)
+    conn.exec_driver_sql(f"INSERT INTO {table} ({cols}) {copy_select.format(legacy=legacy)}")
+    conn.exec_driver_sql(f"DROP TABLE {legacy}")
+
+
+def _valuerecord_to_pence(conn: Connection) -> bool:
+    cols = _columns(conn, "valuerecord")
+    if "value" not in cols:
+        return False
+    _rebuild(
+        conn,
+        "valuerecord",
+        "SELECT id, account_id, CAST(ROUND(value * 100) AS INTEGER), substr(date, 1, 10) "
+        "FROM {legacy}",
+    )
+    return True
+
+
+def _futurecontribution_to_pence_and_date(conn: Connection) -> bool:
+    cols = _columns(conn, "futurecontribution")
+    if "amount" not in cols:
+        return False
+    _rebuild(
+        conn,
+        "futurecontribution",
+        "SELECT id, account_id, CAST(ROUND(amount * 100) AS INTEGER), "
+        "NULLIF(substr(trim(date), 1, 10), ''), recurring "
+        "FROM {legacy}",
+    )
+    return True
+
+
+def _account_currency(conn: Connection) -> bool:
+    if "currency" in _columns(conn, "account"):
+        return False
+    conn.exec_driver_sql("ALTER TABLE account ADD COLUMN currency VARCHAR NOT NULL DEFAULT 'GBP'")
+    return True
+
+
+# (table, step) pairs applied in order; each step is a no-op when its table is
+# already current and returns whether it changed anything.
+STEPS: List[Tuple[str, Callable[[Connection], bool]]] = [
+    ("valuerecord", _valuerecord_to_pence),
+    ("futurecontribution", _futurecontribution_to_pence_and_date),
+    ("account", _account_currency),
+]
+
+
+def upgrade(engine: Engine) -> List[str]:
+    """Bring an existing database up to the current schema. Returns the steps applied."""
+    applied: List[str] = []
+    # pysqlite only opens transactions around DML by default; take control so
+    # the table rebuilds (DDL + copy) commit or roll back as one unit.
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        existing = {row[0] for row in conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        conn.exec_driver_sql("BEGIN")
+        try:
+            for table, step in STEPS:
+                if table in existing and step(conn):
+                    applied.append(step.__name__.lstrip("_"))
+            conn.exec_driver_sql("COMMIT")
+        except Exception:
+            conn.exec_driver_sql("ROLLBACK")
+            raise
+    return applied
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Upgrade a budget.db file to the current schema.")
+    parser.add_argument("db", help="path to the SQLite database file")
+    parser.add_argument("--no-backup", action="store_true", help="skip writing <db>.bak before migrating")
+    args = parser.parse_args(argv)
+
+    if not args.no_backup:
+        shutil.copy2(args.db, args.db + ".bak")
+
+    engine = create_engine(f"sqlite:///{args.db}")
+    SQLModel.metadata.create_all(engine)
+    applied = upgrade(engine)
+    print("applied: " + ", ".join(applied) if applied else "already up to date")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,14 @@
+from sqlalchemy import UniqueConstraint
 from sqlmodel import SQLModel, Field, Relationship
 from typing import List, Optional
-from datetime import date
+import datetime
 
 
 class Account(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str
+    # ISO 4217 code; values and contributions are recorded in this currency
+    currency: str = "GBP"
     # historical value records
     values: List["ValueRecord"] = Relationship(back_populates="account")
     # future planned contributions
@@ -17,22 +20,23 @@ class ValueRecord(SQLModel, table=True):
     Use these as the historical series of account values (including deposits/interest).
     """
     id: Optional[int] = Field(default=None, primary_key=True)
-    account_id: int = Field(foreign_key="account.id")
-    value: float
-    date: date
+    account_id: int = Field(foreign_key="account.id", index=True)
+    # money is stored as integer pence so SQL-side sums stay exact
+    value_pence: int
+    date: datetime.date = Field(index=True)
     account: Optional[Account] = Relationship(back_populates="values")
 
 
 class FutureContribution(SQLModel, table=True):
     """Represents planned future contributions.
-    If `recurring` is True then `amount` is a monthly amount and `date` is the start date.
-    If `recurring` is False then `date` is the one-off payment date and `amount` is the payment.
+    If `recurring` is True then `amount_pence` is a monthly amount and `date` is the start date.
+    If `recurring` is False then `date` is the one-off payment date and `amount_pence` is the payment.
     """
     id: Optional[int] = Field(default=None, primary_key=True)
-    account_id: Optional[int] = Field(default=None, foreign_key="account.id")
-    amount: float
-    # store optional scheduled date as ISO string to avoid SQLModel/date mapping issues
-    date: Optional[str] = None
+    account_id: Optional[int] = Field(default=None, foreign_key="account.id", index=True)
+    # integer pence, see ValueRecord.value_pence
+    amount_pence: int
+    date: Optional[datetime.date] = Field(default=None, index=True)
     recurring: bool = False
     account: Optional[Account] = Relationship(back_populates="future_contributions")
 
@@ -40,3 +44,15 @@ class FutureContribution(SQLModel, table=True):
 class AppSettings(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     total_target: Optional[float] = None
+
+
+class FxRate(SQLModel, table=True):
+    """Value of one unit of `currency` in the base currency on `date`.
+    Imported from a CSV file (see backend/fx.py); the latest rate on or before
+    a given date applies.
+    """
+    __table_args__ = (UniqueConstraint("currency", "date"),)
+    id: Optional[int] = Field(default=None, primary_key=True)
+    currency: str = Field(index=True)
+    date: datetime.date
+    rate: float
@@ -0,0 +1,257 @@
+"""
+Opt-in per-request sampling profiler.
+
+Enabled with BUDGET_PROFILING=1. A request is then profiled when it carries an
+`X-Profile: 1` header or a `?profile=1` query parameter. While it runs, a
+sampler thread snapshots the Python stacks of every thread (sys._current_frames)
+at a fixed interval. This also covers the threadpool workers that FastAPI runs
+sync endpoints, dependencies and response validation on, which an in-thread
+cProfile would miss.
+
+Only work done for the profiled request is kept. The middleware marks the
+request's context with a context variable, which the event loop and the
+threadpool carry into everything they run for it. A thread is sampled only
+while the context it is running code in carries that mark, so concurrent
+unprofiled requests on other workers stay out of the profile.
+
+pydantic 1.x ships compiled, so its validation and serialisation never show
+up as frames of its own; the time appears in FastAPI's calling frame instead.
+Samples stopped in one of those call sites get a synthetic `pydantic:<compiled>`
+leaf frame so they are counted as pydantic.
+
+Finished profiles are kept in a bounded ring buffer and served by the
+/debug/profiles endpoints as folded stacks ("a;b;c 12" per line), the input
+format for flamegraph.pl and speedscope. Only one request is profiled at a
+time; others that ask while one is running are served unprofiled.
+
+Configuration (environment):
+    BUDGET_PROFILING         "1" to enable
+    BUDGET_PROFILE_KEEP      number of profiles kept (default 20)
+    BUDGET_PROFILE_INTERVAL  sampling interval in milliseconds (default 1)
+"""
+
+import collections
+import contextvars
+import datetime
+import itertools
+import os
+import sys
+import threading
+import time
+from typing import Counter, Deque, Dict, List, Optional
+from urllib.parse import parse_qs
+
+# Libraries whose share of the samples is reported separately.
+TRACKED_LIBRARIES = ("sqlalchemy", "sqlmodel", "pydantic", "fastapi", "starlette", "backend")
+
+# A sample whose innermost frame is in one of these modules is a thread waiting
+# for work (idle pool worker, event loop in select), not doing any.
+_IDLE_MODULES = ("threading", "selectors", "queue", "asyncio.base_events")
+
+# FastAPI frames that hand their work straight to compiled pydantic: a sample
+# stopped in one of these is inside pydantic.
+_PYDANTIC_CALL_SITES = frozenset({
+    "fastapi.routing:serialize_response",
+    "fastapi.routing:_prepare_response_content",
+    "fastapi._compat:_model_dump",
+    "fastapi.dependencies.utils:request_params_to_args",
+    "fastapi.dependencies.utils:request_body_to_args",
+})
+_COMPILED_PYDANTIC = "pydantic:<compiled>"
+
+# Functions that call `context.run(...)`: asyncio's Handle._run (with the
+# context on `self`) and the threadpool worker loop (with it in a local).
+_CONTEXT_RUNNERS = frozenset({"_run", "run"})
+
+# Set by the middleware for the request being profiled.
+_active: contextvars.ContextVar[Optional["_Sampler"]] = contextvars.ContextVar("profiled_request", default=None)
+
+
+def _frame_name(frame) -> str:
+    return f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_name}"
+
+
+def _running_context(frame) -> Optional[contextvars.Context]:
+    """The innermost context a thread is running code in, found from its stack."""
+    while frame is not None:
+        if frame.f_code.co_name in _CONTEXT_RUNNERS:
+            local = frame.f_locals
+            ctx = local.get("context")
+            if not isinstance(ctx, contextvars.Context):
+                ctx = getattr(local.get("self"), "_context", None)
+            if isinstance(ctx, contextvars.Context):
+                return ctx
+        frame = frame.f_back
+    return None
+
+
+def _stack(frame) -> List[str]:
+    stack = []
+    leaf = frame
+    while frame is not None:
+        stack.append(_frame_name(frame))
+        frame = frame.f_back
+    stack.reverse()
+    if stack[-1] in _PYDANTIC_CALL_SITES:
+        stack.append(_COMPILED_PYDANTIC)
+    elif leaf.f_code.co_name == "run":
+        # a worker calling a compiled function directly, e.g. field.validate
+        # handed to the threadpool: name it from the worker's `func`
+        func = leaf.f_locals.get("func")
+        module = getattr(func, "__module__", None) or ""
+        if module.split(".", 1)[0] == "pydantic":
+            stack.append(_COMPILED_PYDANTIC)
+    return stack
+
+
+class _Sampler(threading.Thread):
+    def __init__(self, profile_id: int, interval: float):
+        super().__init__(name="request-profiler", daemon=True)
+        self.profile_id = profile_id
+        self.interval = interval
+        self.stacks: Counter[str] = collections.Counter()
+        self.samples = 0
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        me = threading.get_ident()
+        while not self._stop_event.wait(self.interval):
+            for tid, frame in sys._current_frames().items():
+                if tid == me or frame.f_globals.get("__name__") in _IDLE_MODULES:
+                    continue
+                ctx = _running_context(frame)
+                if ctx is None or ctx.get(_active) is not self:
+                    continue  # another request's work, or none at all
+                self.stacks[";".join(_stack(frame))] += 1
+                self.samples += 1
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+
+class Profile:
+    def __init__(self, profile_id: int, method: str, path: str, stacks: Counter[str], samples: int, duration: float):
+        self.id = profile_id
+        self.method = method
+        self.path = path
+        self.stacks = stacks
+        self.samples = samples
+        self.duration = duration
+        self.status: Optional[int] = None
+        self.captured_at = datetime.datetime.now(datetime.timezone.utc)
+
+    def library_share(self) -> Dict[str, float]:
+        """Fraction of samples with at least one frame inside each tracked library."""
+        counts = dict.fromkeys(TRACKED_LIBRARIES, 0)
+        for stack, n in self.stacks.items():
+            modules = {frame.split(":", 1)[0].split(".", 1)[0] for frame in stack.split(";")}
+            for lib in TRACKED_LIBRARIES:
+                if lib in modules:
+                    counts[lib] += n
+        return {lib: (c / self.samples if self.samples else 0.0) for lib, c in counts.items()}
+
+    def summary(self) -> dict:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "status": self.status,
+            "duration_ms": round(self.duration * 1000, 3),
+            "samples": self.samples,
+            "captured_at": self.captured_at,
+            "library_share": self.library_share(),
+        }
+
+    def folded(self) -> str:
+        return "".join(f"{stack} {n}\n" for stack, n in self.stacks.most_common())
+
+
+class ProfileStore:
+    """Ring buffer of the most recent request profiles."""
+
+    def __init__(self, enabled: bool, keep: int, interval: float):
+        self.enabled = enabled
+        self.interval = interval
+        self._profiles: Deque[Profile] = collections.deque(maxlen=keep)
+        self._ids = itertools.count(1)
+        self._busy = threading.Lock()
+
+    def list(self) -> List[Profile]:
+        return list(reversed(self._profiles))
+
+    def get(self, profile_id: int) -> Optional[Profile]:
+        return next((p for p in self._profiles if p.id == profile_id), None)
+
+    def clear(self) -> None:
+        self._profiles.clear()
+
+    def start(self) -> Optional[_Sampler]:
+        """Begin sampling, or return None if another request is already being profiled."""
+        if not self._busy.acquire(blocking=False):
+            return None
+        sampler = _Sampler(next(self._ids), self.interval)
+        sampler.start()
+        return sampler
+
+    def finish(self, sampler: _Sampler, method: str, path: str, duration: float) -> Profile:
+        try:
+            sampler.stop()
+        finally:
+            self._busy.release()
+        profile = Profile(sampler.profile_id, method, path, sampler.stacks, sampler.samples, duration)
+        self._profiles.append(profile)
+        return profile
+
+
+store = ProfileStore(
+    enabled=os.getenv("BUDGET_PROFILING") == "1",
+    keep=int(os.getenv("BUDGET_PROFILE_KEEP", "20")),
+    interval=float(os.getenv("BUDGET_PROFILE_INTERVAL", "1")) / 1000,
+)
+
+
+def _wants_profile(scope) -> bool:
+    for name, value in scope.get("headers", []):
+        if name == b"x-profile" and value == b"1":
+            return True
+    query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+    return query.get("profile") == ["1"]
+
+
+class ProfilingMiddleware:
+    """ASGI middleware; a plain pass-through unless profiling is enabled and requested.
+
+    Profiled responses carry an `X-Profile-Id` header naming the stored profile.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not store.enabled or not _wants_profile(scope):
+            await self.app(scope, receive, send)
+            return
+        sampler = store.start()
+        if sampler is None:
+            await self.app(scope, receive, send)
+            return
+
+        status = {}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"x-profile-id", str(sampler.profile_id).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        t0 = time.perf_counter()
+        token = _active.set(sampler)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _active.reset(token)
+            profile = store.finish(sampler, scope["method"], scope["path"], time.perf_counter() - t0)
+            profile.status = status.get("code")
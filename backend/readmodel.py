@@ -0,0 +1,163 @@
+"""
+Optional in-process read model of the whole dataset.
+
+The household dataset is small, so with BUDGET_READ_MODEL=1 it is loaded into
+memory once at startup and /summary, /accounts and /values are answered from
+it without touching SQLite. The write handlers keep it current by applying
+each committed change in place.
+
+Each account's history is three parallel arrays kept sorted by (date, id):
+int32 days since 1970-01-01, int64 pence and int64 record ids. That is 20
+bytes per value record instead of a full ORM object. The latest balance is
+always the last slot, so /summary needs no search.
+"""
+
+import bisect
+import datetime
+import heapq
+import os
+import threading
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlmodel import Session, select
+
+from .models import Account, AppSettings, ValueRecord
+
+_EPOCH = datetime.date(1970, 1, 1).toordinal()
+
+
+def _to_day(d: datetime.date) -> int:
+    return d.toordinal() - _EPOCH
+
+
+def _from_day(day: int) -> datetime.date:
+    return datetime.date.fromordinal(day + _EPOCH)
+
+
+class _Series:
+    __slots__ = ("days", "pence", "ids")
+
+    def __init__(self):
+        self.days = array("i")
+        self.pence = array("q")
+        self.ids = array("q")
+
+    def insert(self, day: int, pence: int, value_id: int) -> None:
+        # ids only grow, so a new record goes after any others on the same day
+        i = bisect.bisect_right(self.days, day)
+        self.days.insert(i, day)
+        self.pence.insert(i, pence)
+        self.ids.insert(i, value_id)
+
+    def remove(self, value_id: int) -> None:
+        i = self.ids.index(value_id)
+        del self.days[i], self.pence[i], self.ids[i]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+class ReadModel:
+    def __init__(self, enabled: bool):
+        self.enabled = enabled
+        self._loaded = False
+        self._lock = threading.Lock()
+        self._accounts: Dict[int, Tuple[str, str]] = {}
+        self._series: Dict[int, _Series] = {}
+        self._owner: Dict[int, int] = {}  # value id -> account id
+        self._target: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.enabled and self._loaded
+
+    def load(self, session: Session) -> None:
+        accounts = {a.id: (a.name, a.currency) for a in session.exec(select(Account))}
+        series: Dict[int, _Series] = {acct_id: _Series() for acct_id in accounts}
+        owner: Dict[int, int] = {}
+        for v in session.exec(select(ValueRecord).order_by(ValueRecord.account_id, ValueRecord.date, ValueRecord.id)):
+            s = series.setdefault(v.account_id, _Series())
+            s.days.append(_to_day(v.date))
+            s.pence.append(v.value_pence)
+            s.ids.append(v.id)
+            owner[v.id] = v.account_id
+        settings = session.exec(select(AppSettings)).first()
+        with self._lock:
+            self._accounts, self._series, self._owner = accounts, series, owner
+            self._target = settings.total_target if settings else None
+            self._loaded = True
+
+    # -- writes (called by the handlers after commit) -------------------------
+
+    def put_account(self, acct: Account) -> None:
+        if not self.ready:
+            return
+        with self._lock:
+            self._accounts[acct.id] = (acct.name, acct.currency)
+            self._series.setdefault(acct.id, _Series())
+
+    def remove_account(self, account_id: int) -> None:
+        if not self.ready:
+            return
+        with self._lock:
+            self._accounts.pop(account_id, None)
+            s = self._series.pop(account_id, None)
+            for value_id in s.ids if s else ():
+                self._owner.pop(value_id, None)
+
+    def put_value(self, v: ValueRecord) -> None:
+        if not self.ready:
+            return
+        with self._lock:
+            if v.id in self._owner:
+                return  # already there (e.g. loaded after its commit)
+            self._series.setdefault(v.account_id, _Series()).insert(_to_day(v.date), v.value_pence, v.id)
+            self._owner[v.id] = v.account_id
+
+    def remove_value(self, value_id: int) -> None:
+        if not self.ready:
+            return
+        with self._lock:
+            account_id = self._owner.pop(value_id, None)
+            if account_id is not None:
+                self._series[account_id].remove(value_id)
+
+    def set_target(self, target: Optional[float]) -> None:
+        if not self.ready:
+            return
+        with self._lock:
+            self._target = target
+
+    # -- reads ----------------------------------------------------------------
+
+    def accounts(self) -> List[Dict]:
+        with self._lock:
+            return [
+                {"id": acct_id, "name": name, "currency": currency}
+                for acct_id, (name, currency) in sorted(self._accounts.items())
+            ]
+
+    def latest(self) -> Tuple[List[Tuple[int, str, str, int]], Optional[float]]:
+        """(id, name, currency, latest pence or 0) per account, plus the savings target."""
+        with self._lock:
+            rows = [
+                (acct_id, name, currency, self._series[acct_id].pence[-1] if self._series.get(acct_id) else 0)
+                for acct_id, (name, currency) in sorted(self._accounts.items())
+            ]
+            return rows, self._target
+
+    def values(self) -> List[Tuple[int, int, int, datetime.date]]:
+        """(id, account id, pence, date) for every record, ordered by date then id."""
+        with self._lock:
+            streams = [self._iter_series(acct_id, s) for acct_id, s in self._series.items()]
+            merged = heapq.merge(*streams)
+            return [(vid, acct_id, pence, _from_day(day)) for day, vid, acct_id, pence in merged]
+
+    @staticmethod
+    def _iter_series(account_id: int, s: _Series) -> Iterator[Tuple[int, int, int, int]]:
+        for day, value_id, pence in zip(s.days, s.ids, s.pence):
+            yield day, value_id, account_id, pence
+
+
+read_model = ReadModel(enabled=os.getenv("BUDGET_READ_MODEL") == "1")
@@ -2,23 +2,30 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import Session, select
 from typing import List
 
+from .. import analytics, forecast
 from ..db import get_session
 from ..models import Account, FutureContribution, ValueRecord
-from ..schemas import AccountRename
+from ..readmodel import read_model
+from ..schemas import AccountCreate, AccountRename
 
 router = APIRouter(prefix="/accounts", tags=["accounts"])
 
 
 @router.get("", response_model=List[Account])
 def list_accounts(session: Session = Depends(get_session)):
+    if read_model.ready:
+        return read_model.accounts()
     return session.exec(select(Account)).all()
 
 
 @router.post("", response_model=Account)
-def create_account(account: Account, session: Session = Depends(get_session)):
+def create_account(payload: AccountCreate, session: Session = Depends(get_session)):
+    account = payload.to_model()
     session.add(account)
     session.commit()
     session.refresh(account)
+    forecast.cache.clear()
+    read_model.put_account(account)
     return account
 
 
@@ -33,6 +40,9 @@ def delete_account(account_id: int, session: Session = Depends(get_session)):
         session.delete(f)
     session.delete(acct)
     session.commit()
+    analytics.cache.invalidate(account_id)
+    forecast.cache.clear()
+    read_model.remove_account(account_id)
 
 
 @router.patch("/{account_id}", response_model=Account)
@@ -40,8 +50,16 @@ def rename_account(account_id: int, payload: AccountRename, session: Session = D
     acct = session.get(Account, account_id)
     if not acct:
         raise HTTPException(status_code=404, detail="Account not found")
-    acct.name = payload.name
+    if payload.name is not None:
+        acct.name = payload.name
+    currency_changed = payload.currency is not None and payload.currency != acct.currency
+    if currency_changed:
+        acct.currency = payload.currency
     session.add(acct)
     session.commit()
     session.refresh(acct)
+    if currency_changed:
+        # the forecast converts contributions at the account's currency
+        forecast.cache.clear()
+    read_model.put_account(acct)
     return acct
@@ -0,0 +1,62 @@
+import datetime
+from collections import defaultdict
+from typing import Dict, List
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlmodel import Session, select
+
+from .. import analytics
+from ..models import Account, FutureContribution, ValueRecord
+from ..snapshot import get_read_session
+
+router = APIRouter(prefix="/analytics", tags=["analytics"])
+
+
+def _analyse(accounts: List[Account], session: Session) -> List[Dict]:
+    """Return analytics for `accounts`, computing only those missing from the cache."""
+    today = datetime.date.today()
+    # results read from the snapshot are only valid for that snapshot's contents
+    stamp = (today, session.info.get("snapshot_generation"))
+    results = {a.id: analytics.cache.get(a.id, stamp) for a in accounts}
+    missing = [acct_id for acct_id, r in results.items() if r is None]
+
+    if missing:
+        series = defaultdict(lambda: ([], []))
+        for v in session.exec(
+            select(ValueRecord)
+            .where(ValueRecord.account_id.in_(missing))
+            .order_by(ValueRecord.account_id, ValueRecord.date, ValueRecord.id)
+        ):
+            series[v.account_id][0].append(v.date)
+            series[v.account_id][1].append(v.value_pence)
+
+        contribs = defaultdict(list)
+        for f in session.exec(
+            select(FutureContribution).where(FutureContribution.account_id.in_(missing))
+        ):
+            contribs[f.account_id].append(f)
+
+        for acct_id in missing:
+            dates, pence = series[acct_id]
+            result = analytics.analyse_account(
+                dates, pence, analytics.deposit_events(contribs[acct_id], today)
+            )
+            analytics.cache.put(acct_id, stamp, result)
+            results[acct_id] = result
+
+    return [{"account_id": a.id, "name": a.name, **results[a.id]} for a in accounts]
+
+
+@router.get("")
+def list_analytics(session: Session = Depends(get_read_session)):
+    """Growth breakdown (deposits vs returns, CAGR/XIRR, monthly deltas) for every account."""
+    accounts = session.exec(select(Account).order_by(Account.id)).all()
+    return {"accounts": _analyse(accounts, session)}
+
+
+@router.get("/{account_id}")
+def account_analytics(account_id: int, session: Session = Depends(get_read_session)):
+    acct = session.get(Account, account_id)
+    if not acct:
+        raise HTTPException(status_code=404, detail="Account not found")
+    return _analyse([acct], session)[0]
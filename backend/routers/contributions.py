@@ -2,23 +2,30 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import Session, select
 from typing import List
 
+from .. import analytics, forecast
 from ..db import get_session
 from ..models import Account, FutureContribution
+from ..schemas import FutureContributionCreate, FutureContributionRead
 
 router = APIRouter(prefix="/future_contributions", tags=["contributions"])
 
 
-@router.get("", response_model=List[FutureContribution])
+@router.get("", response_model=List[FutureContributionRead])
 def list_future(session: Session = Depends(get_session)):
-    return session.exec(
+    currencies = dict(session.exec(select(Account.id, Account.currency)).all())
+    rows = session.exec(
         select(FutureContribution).order_by(FutureContribution.date)
     ).all()
+    return [FutureContributionRead.from_model(f, currencies.get(f.account_id)) for f in rows]
 
 
-@router.post("", response_model=FutureContribution)
-def create_future(f: FutureContribution, session: Session = Depends(get_session)):
+@router.post("", response_model=FutureContributionRead)
+def create_future(payload: FutureContributionCreate, session: Session = Depends(get_session)):
+    f = payload.to_model()
+    acct = None
     if f.account_id:
-        if not session.get(Account, f.account_id):
+        acct = session.get(Account, f.account_id)
+        if not acct:
             raise HTTPException(status_code=404, detail="Account not found")
 
     # Upsert for recurring: remove any existing recurring entry for this account
@@ -37,7 +44,9 @@ def create_future(f: FutureContribution, session: Session = Depends(get_session)
     session.add(f)
     session.commit()
     session.refresh(f)
-    return f
+    analytics.cache.invalidate(f.account_id)
+    forecast.cache.clear()
+    return FutureContributionRead.from_model(f, acct.currency if acct else None)
 
 
 @router.delete("/{contribution_id}", status_code=204)
@@ -47,3 +56,5 @@ def delete_future(contribution_id: int, session: Session = Depends(get_session))
         raise HTTPException(status_code=404, detail="Contribution not found")
     session.delete(f)
     session.commit()
+    analytics.cache.invalidate(f.account_id)
+    forecast.cache.clear()
@@ -0,0 +1,31 @@
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import PlainTextResponse
+
+from .. import profiling
+
+router = APIRouter(prefix="/debug", tags=["debug"])
+
+
+def _require_profiling():
+    if not profiling.store.enabled:
+        raise HTTPException(status_code=404, detail="Profiling is disabled")
+
+
+@router.get("/profiles")
+def list_profiles():
+    """Most recent request profiles first, with per-library share of samples."""
+    _require_profiling()
+    return [p.summary() for p in profiling.store.list()]
+
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+def download_profile(profile_id: int):
+    """Folded stacks for one profile, ready for flamegraph.pl or speedscope."""
+    _require_profiling()
+    profile = profiling.store.get(profile_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return PlainTextResponse(
+        profile.folded(),
+        headers={"Content-Disposition": f'attachment; filename="profile-{profile_id}.folded"'},
+    )
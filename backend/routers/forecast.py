@@ -0,0 +1,76 @@
+import datetime
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel import Session, select
+
+from .. import forecast, fx
+from ..db import get_session
+from ..models import Account, FutureContribution
+from ..schemas import to_pence
+from .summary import summary
+
+router = APIRouter(prefix="/forecast", tags=["forecast"])
+
+# The Forecast page reads the default surface (which nightly prewarm fills):
+# a £25 grid out to ±£500/mo, at every month of its longest (60-month) chart.
+DEFAULT_STEP = 25.0
+DEFAULT_STEPS = 20
+DEFAULT_HORIZONS = list(range(1, 61))
+
+
+@router.get("/sensitivity")
+def sensitivity(
+    step: float = Query(DEFAULT_STEP, gt=0, description="Spacing of the monthly-rate delta grid (£)"),
+    steps: int = Query(DEFAULT_STEPS, ge=1, le=50, description="Grid points either side of the current rate"),
+    horizons: List[int] = Query(DEFAULT_HORIZONS),
+    session: Session = Depends(get_session),
+):
+    """Projected balance and target-hit month for each account x rate delta x horizon.
+
+    Recurring contributions are converted into the base currency at today's rate,
+    like the /summary total the projection starts from. As in /summary, accounts
+    whose currency has no rate are left out (balance and contributions alike)
+    and their currencies are listed under `missing_rates`.
+    """
+    if any(h < 1 or h > 600 for h in horizons):
+        raise HTTPException(status_code=422, detail="horizons must be between 1 and 600 months")
+    horizons = sorted(set(horizons))
+
+    today = datetime.date.today()
+    current = summary(session)
+    start_pence = to_pence(current["total"])
+    target_pence = None if current["target"] is None else to_pence(current["target"])
+    deltas = forecast.default_deltas(to_pence(step), steps)
+    accounts = session.exec(select(Account).order_by(Account.id)).all()
+    missing = set(current["missing_rates"])
+
+    key = (tuple(deltas), tuple(horizons), start_pence, target_pence, today.year, today.month)
+    surface = forecast.cache.get(key)
+    if surface is None:
+        currency = {a.id: a.currency for a in accounts}
+        rates = {a.id: 0 for a in accounts if a.currency not in missing}
+        unallocated = 0
+        one_offs = []
+        for f in session.exec(select(FutureContribution)):
+            pence = fx.rates.convert(f.amount_pence, currency.get(f.account_id, fx.BASE_CURRENCY), today)
+            if pence is None:
+                continue  # no rate: the account is left out, see missing_rates
+            if not f.recurring:
+                if f.date is not None:
+                    one_offs.append((f.date, pence))
+            elif f.account_id in rates:
+                rates[f.account_id] += pence
+            else:
+                unallocated += pence
+        surface = forecast.build_surface(
+            start_pence, target_pence, rates, unallocated, one_offs, deltas, horizons, today
+        )
+        forecast.cache.put(key, surface)
+
+    names = {a.id: a.name for a in accounts}
+    return {
+        **surface,
+        "accounts": [{**a, "name": names.get(a["id"])} for a in surface["accounts"]],
+        "missing_rates": sorted(missing),
+    }
@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from sqlmodel import Session, select
+from typing import List, Optional
+
+from .. import forecast, fx
+from ..db import get_session
+from ..models import FxRate
+
+router = APIRouter(prefix="/fx_rates", tags=["fx"])
+
+
+@router.get("", response_model=List[FxRate])
+def list_rates(currency: Optional[str] = None, session: Session = Depends(get_session)):
+    query = select(FxRate).order_by(FxRate.currency, FxRate.date)
+    if currency:
+        query = query.where(FxRate.currency == currency.upper())
+    return session.exec(query).all()
+
+
+@router.put("")
+async def import_rates(request: Request, session: Session = Depends(get_session)):
+    """Import a `date,currency,rate` CSV sent as the request body (text/csv)."""
+    try:
+        rows = fx.parse_csv((await request.body()).decode("utf-8-sig"))
+    except (UnicodeDecodeError, ValueError) as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    imported = await run_in_threadpool(fx.import_rates, session, rows)
+    # contributions are converted at import-time rates inside cached surfaces
+    forecast.cache.clear()
+    return {"imported": imported, "base_currency": fx.BASE_CURRENCY}
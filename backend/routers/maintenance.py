@@ -0,0 +1,11 @@
+from fastapi import APIRouter
+
+from ..maintenance import scheduler
+
+router = APIRouter(tags=["maintenance"])
+
+
+@router.get("/maintenance")
+def maintenance_status():
+    """When nightly maintenance next runs, and the status and duration of each job's last run."""
+    return scheduler.status()
@@ -0,0 +1,11 @@
+from fastapi import APIRouter
+
+from ..snapshot import snapshot
+
+router = APIRouter(tags=["snapshot"])
+
+
+@router.get("/snapshot")
+def snapshot_status():
+    """Report when the read-only snapshot was last refreshed and how stale it is."""
+    return snapshot.status()
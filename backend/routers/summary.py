@@ -1,34 +1,78 @@
+import datetime
+
 from fastapi import APIRouter, Depends
+from sqlalchemy import func
 from sqlmodel import Session, select
 
+from .. import fx
 from ..db import get_session
 from ..models import Account, AppSettings, ValueRecord
-from ..schemas import SettingsUpdate
+from ..readmodel import read_model
+from ..schemas import SettingsUpdate, from_pence
 
 router = APIRouter(tags=["summary"])
 
 
+def latest_values_subquery():
+    """Rank each account's value records newest-first; rank 1 is the current balance."""
+    return select(
+        ValueRecord.account_id,
+        ValueRecord.value_pence,
+        func.row_number()
+        .over(
+            partition_by=ValueRecord.account_id,
+            order_by=(ValueRecord.date.desc(), ValueRecord.id.desc()),
+        )
+        .label("rank"),
+    ).subquery()
+
+
 @router.get("/summary")
 def summary(session: Session = Depends(get_session)):
-    """Return current total + per-account breakdown using the latest value records."""
-    accounts = session.exec(select(Account)).all()
-    total_all = 0.0
+    """Return current total + per-account breakdown using the latest value records.
+
+    The per-account pick is done in SQL over integer pence, or taken from the
+    in-memory read model when that is enabled. Each balance is then converted
+    into the base currency at today's FX rate; accounts whose currency has no
+    imported rate show `total: null`, are left out of the grand total and
+    their currencies are listed under `missing_rates`.
+    """
+    today = datetime.date.today()
+    if read_model.ready:
+        rows, target = read_model.latest()
+    else:
+        latest = latest_values_subquery()
+        rows = session.exec(
+            select(Account.id, Account.name, Account.currency, func.coalesce(latest.c.value_pence, 0))
+            .outerjoin(latest, (latest.c.account_id == Account.id) & (latest.c.rank == 1))
+            .order_by(Account.id)
+        ).all()
+        settings = session.exec(select(AppSettings)).first()
+        target = settings.total_target if settings else None
+
+    total_pence = 0
+    missing = set()
     per_account = []
-    for a in accounts:
-        latest = session.exec(
-            select(ValueRecord)
-            .where(ValueRecord.account_id == a.id)
-            .order_by(ValueRecord.date.desc())
-        ).first()
-        val = latest.value if latest else 0.0
-        total_all += val
-        per_account.append({"id": a.id, "name": a.name, "total": val})
+    for acct_id, name, currency, native in rows:
+        pence = fx.rates.convert(native, currency, today)
+        if pence is None:
+            missing.add(currency)
+        else:
+            total_pence += pence
+        per_account.append({
+            "id": acct_id,
+            "name": name,
+            "currency": currency,
+            "native_total": from_pence(native),
+            "total": None if pence is None else from_pence(pence),
+        })
 
-    settings = session.exec(select(AppSettings)).first()
     return {
-        "total": total_all,
-        "target": settings.total_target if settings else None,
+        "total": from_pence(total_pence),
+        "currency": fx.BASE_CURRENCY,
+        "target": target,
         "accounts": per_account,
+        "missing_rates": sorted(missing),
     }
 
 
@@ -54,4 +98,5 @@ def update_settings(payload: SettingsUpdate, session: Session = Depends(get_sess
         session.add(settings)
     session.commit()
     session.refresh(settings)
+    read_model.set_target(settings.total_target)
     return settings
@@ -1,26 +1,54 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlmodel import Session, select
 from typing import List
 
+from .. import analytics
 from ..db import get_session
 from ..models import Account, ValueRecord
+from ..readmodel import read_model
+from ..schemas import ValueRecordCreate, ValueRecordRead
+from ..snapshot import get_read_session
 
 router = APIRouter(prefix="/values", tags=["values"])
 
 
-@router.get("", response_model=List[ValueRecord])
-def list_values(session: Session = Depends(get_session)):
-    return session.exec(select(ValueRecord).order_by(ValueRecord.date)).all()
+def get_history_session(response: Response, live: Session = Depends(get_session)):
+    """The read session for /values, unless the read model answers it.
 
+    Checked before a snapshot session is opened, so in-memory responses don't
+    carry an X-Snapshot-Age for data that didn't come from the snapshot.
+    """
+    if read_model.ready:
+        yield live  # not queried
+        return
+    yield from get_read_session(response, live)
 
-@router.post("", response_model=ValueRecord)
-def create_value(value: ValueRecord, session: Session = Depends(get_session)):
-    if not session.get(Account, value.account_id):
+
+@router.get("", response_model=List[ValueRecordRead])
+def list_values(session: Session = Depends(get_history_session)):
+    if read_model.ready:
+        currencies = {a["id"]: a["currency"] for a in read_model.accounts()}
+        return [
+            ValueRecordRead.from_parts(vid, acct_id, pence, on, currencies.get(acct_id))
+            for vid, acct_id, pence, on in read_model.values()
+        ]
+    currencies = dict(session.exec(select(Account.id, Account.currency)).all())
+    rows = session.exec(select(ValueRecord).order_by(ValueRecord.date)).all()
+    return [ValueRecordRead.from_model(v, currencies.get(v.account_id)) for v in rows]
+
+
+@router.post("", response_model=ValueRecordRead)
+def create_value(payload: ValueRecordCreate, session: Session = Depends(get_session)):
+    acct = session.get(Account, payload.account_id)
+    if not acct:
         raise HTTPException(status_code=404, detail="Account not found")
+    value = payload.to_model()
     session.add(value)
     session.commit()
     session.refresh(value)
-    return value
+    analytics.cache.invalidate(value.account_id)
+    read_model.put_value(value)
+    return ValueRecordRead.from_model(value, acct.currency)
 
 
 @router.delete("/{value_id}", status_code=204)
@@ -30,3 +58,5 @@ def delete_value(value_id: int, session: Session = Depends(get_session)):
         raise HTTPException(status_code=404, detail="Value record not found")
     session.delete(v)
     session.commit()
+    analytics.cache.invalidate(v.account_id)
+    read_model.remove_value(value_id)
@@ -1,9 +1,143 @@
-from pydantic import BaseModel
+import datetime
+import re
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Optional
+
+from pydantic import BaseModel, validator
+
+from . import fx
+from .models import Account, FutureContribution, ValueRecord
+
+
+def to_pence(pounds: float) -> int:
+    """Convert a pounds amount from the API into integer pence, rounding half up."""
+    return int((Decimal(str(pounds)) * 100).quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+
+
+def from_pence(pence: int) -> float:
+    """Convert stored integer pence back into the pounds float the API exposes."""
+    return pence / 100
 
 
 class SettingsUpdate(BaseModel):
     total_target: float
 
 
-class AccountRename(BaseModel):
+def iso_currency_code(cls, v):
+    # stored upper-case so it matches the codes FX rates are imported under
+    v = v.strip().upper()
+    if not re.fullmatch(r"[A-Z]{3}", v):
+        raise ValueError("currency must be a three-letter ISO 4217 code, e.g. USD")
+    return v
+
+
+class AccountCreate(BaseModel):
     name: str
+    currency: str = "GBP"
+
+    _currency = validator("currency", allow_reuse=True)(iso_currency_code)
+
+    def to_model(self) -> Account:
+        return Account(name=self.name, currency=self.currency)
+
+
+class AccountRename(BaseModel):
+    """PATCH body: any field left out keeps its current value."""
+    name: Optional[str] = None
+    currency: Optional[str] = None
+
+    _currency = validator("currency", allow_reuse=True)(iso_currency_code)
+
+
+# ---------------------------------------------------------------------------
+# Compatibility layer: the API speaks pounds (float) while the tables store
+# integer pence. These schemas convert at the boundary.
+# ---------------------------------------------------------------------------
+
+class ValueRecordCreate(BaseModel):
+    account_id: int
+    value: float
+    date: datetime.date
+
+    def to_model(self) -> ValueRecord:
+        return ValueRecord(account_id=self.account_id, value_pence=to_pence(self.value), date=self.date)
+
+
+class ValueRecordRead(BaseModel):
+    id: int
+    account_id: int
+    # in the account's own currency
+    value: float
+    date: datetime.date
+    currency: Optional[str] = None
+    # `value` converted into the base currency at that date's FX rate;
+    # None when no rate is known for the account's currency
+    base_value: Optional[float] = None
+
+    @classmethod
+    def from_model(cls, v: ValueRecord, currency: Optional[str] = None) -> "ValueRecordRead":
+        return cls.from_parts(v.id, v.account_id, v.value_pence, v.date, currency)
+
+    @classmethod
+    def from_parts(
+        cls, id: int, account_id: int, pence: int, date: datetime.date, currency: Optional[str] = None
+    ) -> "ValueRecordRead":
+        base_value = None
+        if currency is not None:
+            base_pence = fx.rates.convert(pence, currency, date)
+            base_value = None if base_pence is None else from_pence(base_pence)
+        return cls(
+            id=id,
+            account_id=account_id,
+            value=from_pence(pence),
+            date=date,
+            currency=currency,
+            base_value=base_value,
+        )
+
+
+class FutureContributionCreate(BaseModel):
+    account_id: Optional[int] = None
+    amount: float
+    date: Optional[datetime.date] = None
+    recurring: bool = False
+
+    @validator("date", pre=True)
+    def blank_date_is_none(cls, v):
+        # the one-off form posts "" when no date has been picked
+        return v or None
+
+    def to_model(self) -> FutureContribution:
+        return FutureContribution(
+            account_id=self.account_id,
+            amount_pence=to_pence(self.amount),
+            date=self.date,
+            recurring=self.recurring,
+        )
+
+
+class FutureContributionRead(BaseModel):
+    id: int
+    account_id: Optional[int] = None
+    amount: float
+    date: Optional[datetime.date] = None
+    recurring: bool
+    # `amount` is in `currency` (the account's; the base currency when unallocated).
+    # `base_amount` is it converted at today's FX rate, as the projection uses it;
+    # None when no rate is known
+    currency: str = fx.BASE_CURRENCY
+    base_amount: Optional[float] = None
+
+    @classmethod
+    def from_model(cls, f: FutureContribution, currency: Optional[str] = None) -> "FutureContributionRead":
+        currency = currency or fx.BASE_CURRENCY
+        base_pence = fx.rates.convert(f.amount_pence, currency, datetime.date.today())
+        return cls(
+            id=f.id,
+            account_id=f.account_id,
+            amount=from_pence(f.amount_pence),
+            date=f.date,
+            recurring=f.recurring,
+            currency=currency,
+            base_amount=None if base_pence is None else from_pence(base_pence),
+        )
@@ -1,6 +1,6 @@
 from sqlmodel import Session, select
 
-from .db import engine
+from . import db
 from .models import AppSettings
 
 
@@ -10,7 +10,7 @@ def seed():
     All accounts, values, and contributions are configured by the user through
     the Settings page — no personal data is baked into the codebase.
     """
-    with Session(engine) as session:
+    with Session(db.engine) as session:
         if not session.exec(select(AppSettings)).first():
             session.add(AppSettings(total_target=None))
             session.commit()
@@ -0,0 +1,134 @@
+"""
+Periodically refreshed read-only copy of the live database.
+
+A background task copies the live database into a snapshot file with
+SQLite's online backup API, a few pages at a time, so UI writes are never
+blocked for long. The snapshot doubles as an on-disk backup, and heavy read
+endpoints (history, analytics) can be served from it via `get_read_session`
+so they don't compete with writers.
+
+Configuration (environment):
+    BUDGET_SNAPSHOT_INTERVAL   seconds between refreshes; 0 (default) disables the task
+    BUDGET_SNAPSHOT_PATH       snapshot file; defaults to "<live db>.snapshot"
+    BUDGET_READ_FROM_SNAPSHOT  "1" to route heavy reads to the snapshot once it exists
+"""
+
+import asyncio
+import datetime
+import logging
+import os
+import sqlite3
+import threading
+from typing import Generator, Optional
+
+from fastapi import Depends, Response
+from sqlalchemy.pool import NullPool
+from sqlmodel import Session, create_engine
+
+from . import db
+
+logger = logging.getLogger(__name__)
+
+# Pages copied per backup step; the source is only locked while a step runs.
+BACKUP_PAGES_PER_STEP = 256
+
+
+def _default_path() -> Optional[str]:
+    prefix = "sqlite:///"
+    if db.DATABASE_URL.startswith(prefix) and len(db.DATABASE_URL) > len(prefix):
+        return db.DATABASE_URL[len(prefix):] + ".snapshot"
+    return None  # in-memory or non-SQLite database: nothing to snapshot by default
+
+
+class Snapshot:
+    def __init__(self, path: Optional[str], interval: float, enabled: bool):
+        self.path = path
+        self.interval = interval
+        # route heavy reads here once a snapshot exists
+        self.enabled = enabled
+        self.refreshed_at: Optional[datetime.datetime] = None
+        # bumped on every refresh so caches can tell snapshot contents apart
+        self.generation = 0
+        self._engine = None
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self._engine is not None
+
+    def age_seconds(self) -> Optional[float]:
+        if self.refreshed_at is None:
+            return None
+        return (datetime.datetime.now(datetime.timezone.utc) - self.refreshed_at).total_seconds()
+
+    def refresh(self) -> None:
+        """Copy the live database into the snapshot file and swap it in atomically."""
+        if not self.path:
+            raise RuntimeError("No snapshot path configured")
+        tmp = self.path + ".tmp"
+        raw = db.engine.raw_connection()
+        try:
+            dst = sqlite3.connect(tmp)
+            try:
+                raw.connection.backup(dst, pages=BACKUP_PAGES_PER_STEP, sleep=0.005)
+            finally:
+                dst.close()
+        finally:
+            raw.close()
+        # readers holding the old file keep their view; new sessions open the new one
+        os.replace(tmp, self.path)
+        with self._lock:
+            self.refreshed_at = datetime.datetime.now(datetime.timezone.utc)
+            self.generation += 1
+            if self._engine is None:
+                self._engine = create_engine(
+                    f"sqlite:///file:{self.path}?mode=ro&uri=true",
+                    connect_args={"check_same_thread": False},
+                    poolclass=NullPool,
+                )
+
+    def session(self) -> Session:
+        session = Session(self._engine)
+        session.info["snapshot_generation"] = self.generation
+        return session
+
+    def status(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "path": self.path,
+            "interval_seconds": self.interval,
+            "refreshed_at": self.refreshed_at,
+            "age_seconds": self.age_seconds(),
+            "generation": self.generation,
+        }
+
+    async def run(self) -> None:
+        """Refresh forever, every `interval` seconds. Errors are logged, not raised."""
+        while True:
+            try:
+                await asyncio.to_thread(self.refresh)
+            except Exception:
+                logger.exception("Snapshot refresh failed")
+            await asyncio.sleep(self.interval)
+
+
+snapshot = Snapshot(
+    path=os.getenv("BUDGET_SNAPSHOT_PATH") or _default_path(),
+    interval=float(os.getenv("BUDGET_SNAPSHOT_INTERVAL", "0")),
+    enabled=os.getenv("BUDGET_READ_FROM_SNAPSHOT") == "1",
+)
+
+
+def get_read_session(
+    response: Response, live: Session = Depends(db.get_session)
+) -> Generator[Session, None, None]:
+    """Session for heavy read endpoints: the snapshot when routing is on and one exists, else the live DB.
+
+    Snapshot-served responses carry an `X-Snapshot-Age` header (seconds).
+    """
+    if not (snapshot.enabled and snapshot.ready):
+        yield live
+        return
+    response.headers["X-Snapshot-Age"] = f"{snapshot.age_seconds():.0f}"
+    with snapshot.session() as session:
+        yield session
@@ -0,0 +1,129 @@
+"""Tests for the /analytics router and the backend.analytics helpers."""
+
+import datetime
+
+import pytest
+
+from backend.analytics import analyse_account, deposit_events
+from backend.models import FutureContribution
+
+
+def _d(s):
+    return datetime.date.fromisoformat(s)
+
+
+# ---------------------------------------------------------------------------
+# analyse_account / deposit_events
+# ---------------------------------------------------------------------------
+
+def test_analyse_account_empty_series():
+    result = analyse_account([], [], [])
+    assert result["months"] == []
+    assert result["cagr"] is None
+
+
+def test_analyse_account_uses_last_value_per_month_and_splits_growth():
+    dates = [_d("2026-01-05"), _d("2026-01-20"), _d("2026-02-15"), _d("2026-03-15")]
+    pence = [10000, 10500, 12000, 13000]
+    deposits = [(_d("2026-02-01"), 1000), (_d("2026-03-01"), 500)]
+
+    result = analyse_account(dates, pence, deposits)
+
+    assert [m["month"] for m in result["months"]] == ["2026-01", "2026-02", "2026-03"]
+    assert [m["value"] for m in result["months"]] == [105.0, 120.0, 130.0]
+    assert [m["delta"] for m in result["months"]] == [0.0, 15.0, 10.0]
+    assert [m["contributions"] for m in result["months"]] == [0.0, 10.0, 5.0]
+    assert [m["returns"] for m in result["months"]] == [0.0, 5.0, 5.0]
+    assert result["start_date"] == _d("2026-01-20")
+    assert result["growth"] == 25.0
+    assert result["contributions"] == 15.0
+    assert result["returns"] == 10.0
+
+
+def test_deposit_after_last_reading_is_not_counted_yet():
+    dates = [_d("2026-01-01"), _d("2026-02-01")]
+    result = analyse_account(dates, [10000, 10000], [(_d("2026-02-20"), 5000)])
+
+    assert result["contributions"] == 0.0
+    assert result["returns"] == 0.0
+    # XIRR leaves the deposit out as well
+    assert result["xirr"] == pytest.approx(0.0, abs=1e-9)
+
+
+def test_mid_month_deposit_lands_on_the_next_reading():
+    dates = [_d("2026-01-01"), _d("2026-02-01"), _d("2026-03-01")]
+    pence = [10000, 10000, 15000]
+    # paid in mid-January, so it belongs to the 1 February reading, not January's
+    deposits = [(_d("2026-01-15"), 5000)]
+
+    result = analyse_account(dates, pence, deposits)
+
+    assert [m["contributions"] for m in result["months"]] == [0.0, 50.0, 0.0]
+    assert [m["returns"] for m in result["months"]] == [0.0, -50.0, 50.0]
+    assert result["contributions"] == 50.0
+    assert result["returns"] == 0.0
+    # breakdown and XIRR count the same deposit: no gain overall
+    assert result["xirr"] == pytest.approx(0.0, abs=1e-9)
+
+
+def test_analyse_account_rolling_delta_and_rates():
+    dates = [_d(f"2026-{m:02d}-01") for m in range(1, 6)]
+    pence = [10000, 10100, 10200, 10300, 10400]
+
+    result = analyse_account(dates, pence, [])
+
+    rolling = [m["rolling_delta"] for m in result["months"]]
+    assert rolling[:3] == [None, None, None]
+    assert rolling[3:] == [1.0, 1.0]
+    # with no deposits money-weighted and time-weighted growth agree
+    assert result["cagr"] == pytest.approx(result["xirr"], rel=1e-6)
+    assert result["cagr"] > 0
+
+
+def test_deposit_events_expands_recurring_up_to_as_of():
+    contribs = [
+        FutureContribution(account_id=1, amount_pence=500, date=_d("2026-01-31"), recurring=True),
+        FutureContribution(account_id=1, amount_pence=900, date=_d("2026-05-01"), recurring=False),
+        FutureContribution(account_id=1, amount_pence=100, date=None, recurring=False),
+    ]
+    events = deposit_events(contribs, _d("2026-03-30"))
+    assert events == [(_d("2026-01-31"), 500), (_d("2026-02-28"), 500), (_d("2026-03-28"), 500)]
+
+
+# ---------------------------------------------------------------------------
+# GET /analytics
+# ---------------------------------------------------------------------------
+
+def test_analytics_endpoint_lists_every_account(client):
+    a1 = client.post("/accounts", json={"name": "ISA A"}).json()["id"]
+    client.post("/accounts", json={"name": "ISA B"})
+    client.post("/values", json={"account_id": a1, "value": 100.0, "date": "2026-01-01"})
+    client.post("/values", json={"account_id": a1, "value": 150.0, "date": "2026-02-01"})
+    client.post(
+        "/future_contributions",
+        json={"account_id": a1, "amount": 40.0, "date": "2026-02-01", "recurring": False},
+    )
+
+    data = client.get("/analytics").json()["accounts"]
+    assert [a["name"] for a in data] == ["ISA A", "ISA B"]
+    assert data[0]["contributions"] == 40.0
+    assert data[0]["returns"] == 10.0
+    assert data[1]["months"] == []
+
+
+def test_analytics_cache_is_invalidated_by_new_values(client):
+    acct_id = client.post("/accounts", json={"name": "ISA"}).json()["id"]
+    client.post("/values", json={"account_id": acct_id, "value": 100.0, "date": "2026-01-01"})
+    assert client.get(f"/analytics/{acct_id}").json()["end_value"] == 100.0
+
+    value_id = client.post(
+        "/values", json={"account_id": acct_id, "value": 120.0, "date": "2026-02-01"}
+    ).json()["id"]
+    assert client.get(f"/analytics/{acct_id}").json()["end_value"] == 120.0
+
+    client.delete(f"/values/{value_id}")
+    assert client.get(f"/analytics/{acct_id}").json()["end_value"] == 100.0
+
+
+def test_analytics_unknown_account_returns_404(client):
+    assert client.get("/analytics/99999").status_code == 404
@@ -0,0 +1,138 @@
+"""Tests for the append-only audit log and replay."""
+
+import datetime
+import threading
+import time
+
+import pytest
+from sqlmodel import Session, create_engine, select
+
+from backend import audit
+from backend.models import Account, ValueRecord
+
+
+@pytest.fixture()
+def audit_log(client, tmp_path, monkeypatch):
+    """An audit log writing to tmp_path, opened against the test database."""
+    import backend.db as db_module
+
+    log = audit.AuditLog(str(tmp_path / "budget.audit"))
+    monkeypatch.setattr(audit, "log", log)
+    with Session(db_module.engine) as session:
+        log.open(session)
+    yield log
+    log.close()
+
+
+def test_mutations_are_logged_after_commit(client, audit_log):
+    acct_id = client.post("/accounts", json={"name": "ISA"}).json()["id"]
+    client.patch(f"/accounts/{acct_id}", json={"name": "Renamed"})
+    client.post("/values", json={"account_id": acct_id, "value": 42.0, "date": "2026-01-01"})
+    client.put("/settings", json={"total_target": 100.0})
+    client.delete(f"/accounts/{acct_id}")
+    audit_log.flush()
+
+    events = [(e["op"], e["t"]) for e in audit.iter_events(audit_log.path)]
+    assert ("i", "account") in events
+    assert ("u", "account") in events
+    assert ("i", "valuerecord") in events
+    assert ("i", "appsettings") in events or ("u", "appsettings") in events
+    # cascade delete logs the value record as well as the account
+    assert events[-2:] in ([("d", "valuerecord"), ("d", "account")], [("d", "account"), ("d", "valuerecord")])
+
+
+def test_new_log_starts_with_baseline_of_existing_rows(client, tmp_path):
+    import backend.db as db_module
+
+    client.post("/accounts", json={"name": "Existing"})
+    log = audit.AuditLog(str(tmp_path / "late.audit"))
+    with Session(db_module.engine) as session:
+        log.open(session)
+    log.close()
+
+    events = list(audit.iter_events(log.path))
+    assert [(e["op"], e["t"], e["r"]["name"]) for e in events if e["t"] == "account"] == [
+        ("i", "account", "Existing")
+    ]
+
+
+def test_replay_rebuilds_database_to_point_in_time(client, audit_log, tmp_path):
+    acct_id = client.post("/accounts", json={"name": "Precious ISA"}).json()["id"]
+    client.post("/values", json={"account_id": acct_id, "value": 69.0, "date": "2026-03-01"})
+    audit_log.flush()
+    before_delete = datetime.datetime.now()
+    time.sleep(0.01)
+    client.delete(f"/accounts/{acct_id}")
+    audit_log.flush()
+
+    restored = create_engine(f"sqlite:///{tmp_path / 'restored.db'}")
+    audit.replay(audit_log.path, restored, until=before_delete)
+    with Session(restored) as session:
+        assert [a.name for a in session.exec(select(Account))] == ["Precious ISA"]
+        value = session.exec(select(ValueRecord)).one()
+        assert value.value_pence == 6900
+        assert value.date == datetime.date(2026, 3, 1)
+
+    latest = create_engine(f"sqlite:///{tmp_path / 'latest.db'}")
+    audit.replay(audit_log.path, latest)
+    with Session(latest) as session:
+        assert session.exec(select(Account)).all() == []
+
+
+def test_concurrent_commits_are_stamped_in_file_order(audit_log):
+    def commit(n):
+        for i in range(50):
+            audit_log.append([("i", "account", {"id": n * 1000 + i, "name": "x"})])
+
+    threads = [threading.Thread(target=commit, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    audit_log.flush()
+
+    stamps = [e["ts"] for e in audit.iter_events(audit_log.path)]
+    assert stamps == sorted(stamps)
+
+
+def test_replay_skips_late_events_instead_of_stopping(tmp_path):
+    base = datetime.datetime(2026, 1, 1)
+    path = tmp_path / "budget.audit"
+
+    def ts(seconds):
+        return int((base + datetime.timedelta(seconds=seconds)).timestamp() * 1_000_000)
+
+    with open(path, "wb") as fh:
+        fh.write(audit.MAGIC)
+        # written out of timestamp order, as a wall-clock step back could leave it
+        for seconds, acct_id in ((1, 1), (3, 2), (2, 3)):
+            fh.write(audit._frame(ts(seconds), "i", "account", {"id": acct_id, "name": f"A{acct_id}"}))
+
+    restored = create_engine(f"sqlite:///{tmp_path / 'restored.db'}")
+    assert audit.replay(str(path), restored, until=base + datetime.timedelta(seconds=2.5)) == 2
+    with Session(restored) as session:
+        assert sorted(a.id for a in session.exec(select(Account))) == [1, 3]
+
+
+def test_torn_tail_is_ignored_and_truncated_on_reopen(client, audit_log):
+    client.post("/accounts", json={"name": "ISA"})
+    audit_log.close()
+    good = list(audit.iter_events(audit_log.path))
+    with open(audit_log.path, "ab") as fh:
+        fh.write(b"\x00\x00\x01\x00garbage")
+
+    assert list(audit.iter_events(audit_log.path)) == good
+
+    import backend.db as db_module
+    with Session(db_module.engine) as session:
+        audit_log.open(session)
+    client.post("/accounts", json={"name": "After crash"})
+    audit_log.flush()
+    names = [e["r"].get("name") for e in audit.iter_events(audit_log.path) if e["t"] == "account"]
+    assert names[-1] == "After crash"
+
+
+def test_cli_replay_refuses_existing_file(audit_log, tmp_path):
+    existing = tmp_path / "exists.db"
+    existing.write_bytes(b"")
+    assert audit.main(["replay", audit_log.path, str(existing)]) == 1
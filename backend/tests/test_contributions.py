@@ -167,3 +167,13 @@ def test_delete_contribution_removes_it_from_list(client):
 def test_delete_contribution_not_found_returns_404(client):
     resp = client.delete("/future_contributions/99999")
     assert resp.status_code == 404
+
+
+def test_create_contribution_blank_date_is_stored_as_null(client):
+    """The one-off form posts an empty string when no date is picked."""
+    resp = client.post(
+        "/future_contributions",
+        json={"amount": 7.0, "date": "", "recurring": False},
+    )
+    assert resp.status_code == 200
+    assert resp.json()["date"] is None
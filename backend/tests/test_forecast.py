@@ -0,0 +1,124 @@
+"""Tests for the /forecast/sensitivity surface and backend.forecast."""
+
+import datetime
+
+from backend.forecast import build_surface
+
+
+TODAY = datetime.date(2026, 1, 15)
+
+
+def test_build_surface_baseline_matches_linear_projection():
+    s = build_surface(
+        start_total_pence=100_00,
+        target_pence=None,
+        account_rates_pence={1: 10_00},
+        unallocated_rate_pence=0,
+        one_offs=[(datetime.date(2026, 2, 3), 50_00), (datetime.date(2025, 12, 1), 999_00)],
+        deltas_pence=[0],
+        horizons=[1, 2, 3],
+        today=TODAY,
+    )
+    # Jan +10, Feb +10 +50 one-off, Mar +10; the past one-off is ignored
+    assert s["baseline"]["balances"] == [110.0, 170.0, 180.0]
+    assert s["accounts"][0]["balances"] == [[110.0, 170.0, 180.0]]
+    assert s["start_month"] == "2026-01"
+
+
+def test_build_surface_deltas_and_clamping():
+    s = build_surface(
+        start_total_pence=0,
+        target_pence=None,
+        account_rates_pence={1: 10_00, 2: 30_00},
+        unallocated_rate_pence=0,
+        one_offs=[],
+        deltas_pence=[-20_00, 0, 20_00],
+        horizons=[12],
+        today=TODAY,
+    )
+    a1, a2 = s["accounts"]
+    # account 1 can only drop by its own £10/month
+    assert [row[0] for row in a1["balances"]] == [360.0, 480.0, 720.0]
+    assert [row[0] for row in a2["balances"]] == [240.0, 480.0, 720.0]
+
+
+def test_build_surface_target_hit_month():
+    s = build_surface(
+        start_total_pence=0,
+        target_pence=100_00,
+        account_rates_pence={1: 25_00},
+        unallocated_rate_pence=0,
+        one_offs=[],
+        deltas_pence=[-25_00, 0, 25_00],
+        horizons=[6],
+        today=TODAY,
+    )
+    assert s["baseline"]["months_to_target"] == 4
+    assert s["baseline"]["target_month"] == "2026-04"
+    assert s["accounts"][0]["months_to_target"] == [None, 4, 2]
+    assert s["accounts"][0]["target_month"] == [None, "2026-04", "2026-02"]
+
+
+# ---------------------------------------------------------------------------
+# GET /forecast/sensitivity
+# ---------------------------------------------------------------------------
+
+def test_sensitivity_endpoint_uses_summary_and_contributions(client):
+    acct_id = client.post("/accounts", json={"name": "ISA"}).json()["id"]
+    client.post("/values", json={"account_id": acct_id, "value": 100.0, "date": "2026-01-01"})
+    client.post(
+        "/future_contributions",
+        json={"account_id": acct_id, "amount": 10.0, "date": "2026-01-01", "recurring": True},
+    )
+
+    data = client.get("/forecast/sensitivity?step=5&steps=1&horizons=12&horizons=6").json()
+    assert data["horizons"] == [6, 12]
+    assert data["deltas"] == [-5.0, 0.0, 5.0]
+    assert data["baseline"]["balances"] == [160.0, 220.0]
+    assert data["accounts"][0]["name"] == "ISA"
+    assert data["accounts"][0]["balances"][2] == [190.0, 280.0]
+
+
+def test_default_surface_has_every_month_the_forecast_page_charts(client):
+    acct_id = client.post("/accounts", json={"name": "ISA"}).json()["id"]
+    client.post(
+        "/future_contributions",
+        json={"account_id": acct_id, "amount": 10.0, "date": "2026-01-01", "recurring": True},
+    )
+
+    data = client.get("/forecast/sensitivity").json()
+    assert data["horizons"] == list(range(1, 61))
+    assert data["deltas"][0] == -500.0 and data["deltas"][-1] == 500.0
+    assert data["baseline"]["balances"][:3] == [10.0, 20.0, 30.0]
+
+
+def test_sensitivity_cache_is_refreshed_when_contributions_change(client):
+    acct_id = client.post("/accounts", json={"name": "ISA"}).json()["id"]
+    first = client.get("/forecast/sensitivity?horizons=12").json()
+    assert first["baseline"]["monthly_rate"] == 0.0
+
+    client.post(
+        "/future_contributions",
+        json={"account_id": acct_id, "amount": 42.0, "date": "2026-01-01", "recurring": True},
+    )
+    second = client.get("/forecast/sensitivity?horizons=12").json()
+    assert second["baseline"]["monthly_rate"] == 42.0
+
+
+def test_sensitivity_leaves_out_accounts_without_a_rate(client):
+    isa = client.post("/accounts", json={"name": "ISA"}).json()["id"]
+    yen = client.post("/accounts", json={"name": "Yen", "currency": "JPY"}).json()["id"]
+    for acct_id, amount in ((isa, 10.0), (yen, 100.0)):
+        client.post(
+            "/future_contributions",
+            json={"account_id": acct_id, "amount": amount, "date": "2026-01-01", "recurring": True},
+        )
+
+    data = client.get("/forecast/sensitivity?horizons=12").json()
+    assert data["baseline"]["monthly_rate"] == 10.0
+    assert [a["id"] for a in data["accounts"]] == [isa]
+    assert data["missing_rates"] == ["JPY"]
+
+
+def test_sensitivity_rejects_out_of_range_horizon(client):
+    assert client.get("/forecast/sensitivity?horizons=0").status_code == 422
@@ -0,0 +1,165 @@
+"""Tests for multi-currency accounts, the FX rate table and /fx_rates."""
+
+import datetime
+
+import pytest
+
+from backend.fx import RateTable, parse_csv
+
+
+RATES_CSV = """date,currency,rate
+2026-01-01,USD,0.80
+2026-02-01,USD,0.75
+2026-01-01,EUR,0.85
+"""
+
+
+def _import(client, text=RATES_CSV):
+    return client.put("/fx_rates", content=text, headers={"Content-Type": "text/csv"})
+
+
+# ---------------------------------------------------------------------------
+# parse_csv / RateTable
+# ---------------------------------------------------------------------------
+
+def test_parse_csv_rejects_missing_columns():
+    with pytest.raises(ValueError):
+        parse_csv("date,rate\n2026-01-01,0.8\n")
+
+
+def test_parse_csv_reports_bad_line():
+    with pytest.raises(ValueError, match="line 3"):
+        parse_csv("date,currency,rate\n2026-01-01,USD,0.8\nnot-a-date,USD,0.8\n")
+
+
+# ---------------------------------------------------------------------------
+# PUT / GET /fx_rates
+# ---------------------------------------------------------------------------
+
+def test_import_rates_and_list(client):
+    resp = _import(client)
+    assert resp.status_code == 200
+    assert resp.json()["imported"] == 3
+
+    usd = client.get("/fx_rates?currency=usd").json()
+    assert [(r["date"], r["rate"]) for r in usd] == [("2026-01-01", 0.8), ("2026-02-01", 0.75)]
+
+
+def test_reimport_replaces_rate_for_same_day(client):
+    _import(client)
+    _import(client, "date,currency,rate\n2026-01-01,USD,0.9\n")
+
+    usd = client.get("/fx_rates?currency=USD").json()
+    assert len(usd) == 2
+    assert usd[0]["rate"] == 0.9
+
+
+def test_import_invalid_csv_returns_422(client):
+    assert _import(client, "nonsense").status_code == 422
+
+
+# ---------------------------------------------------------------------------
+# Conversion in /values and /summary
+# ---------------------------------------------------------------------------
+
+def test_accounts_default_to_gbp(client):
+    assert client.post("/accounts", json={"name": "ISA"}).json()["currency"] == "GBP"
+
+
+def test_list_values_converts_at_each_records_date(client):
+    _import(client)
+    acct_id = client.post("/accounts", json={"name": "Brokerage", "currency": "USD"}).json()["id"]
+    client.post("/values", json={"account_id": acct_id, "value": 100.0, "date": "2025-12-15"})
+    client.post("/values", json={"account_id": acct_id, "value": 100.0, "date": "2026-01-20"})
+    client.post("/values", json={"account_id": acct_id, "value": 100.0, "date": "2026-03-01"})
+
+    values = client.get("/values").json()
+    assert [v["value"] for v in values] == [100.0, 100.0, 100.0]
+    # before the first rate, the earliest known rate applies
+    assert [v["base_value"] for v in values] == [80.0, 80.0, 75.0]
+    assert all(v["currency"] == "USD" for v in values)
+
+
+def test_summary_converts_totals_into_base_currency(client):
+    _import(client)
+    gbp = client.post("/accounts", json={"name": "ISA"}).json()["id"]
+    usd = client.post("/accounts", json={"name": "Brokerage", "currency": "USD"}).json()["id"]
+    client.post("/values", json={"account_id": gbp, "value": 10.0, "date": "2026-01-01"})
+    client.post("/values", json={"account_id": usd, "value": 100.0, "date": "2026-01-01"})
+
+    data = client.get("/summary").json()
+    assert data["currency"] == "GBP"
+    assert data["total"] == 85.0
+    brokerage = next(a for a in data["accounts"] if a["id"] == usd)
+    assert brokerage["native_total"] == 100.0
+    assert brokerage["total"] == 75.0
+    assert data["missing_rates"] == []
+
+
+def test_summary_excludes_accounts_without_a_rate(client):
+    acct = client.post("/accounts", json={"name": "Yen", "currency": "JPY"}).json()["id"]
+    client.post("/values", json={"account_id": acct, "value": 1000.0, "date": "2026-01-01"})
+
+    data = client.get("/summary").json()
+    assert data["total"] == 0.0
+    assert data["accounts"][0]["total"] is None
+    assert data["missing_rates"] == ["JPY"]
+
+
+def test_rate_table_lookup_picks_latest_rate_on_or_before():
+    from backend.models import FxRate
+
+    class _Session:
+        def exec(self, _):
+            return [
+                FxRate(currency="USD", date=datetime.date(2026, 1, 1), rate=0.8),
+                FxRate(currency="USD", date=datetime.date(2026, 2, 1), rate=0.75),
+            ]
+
+    table = RateTable()
+    table.load(_Session())
+    assert table.rate("usd", datetime.date(2026, 1, 31)) == 0.8
+    assert table.rate("USD", datetime.date(2026, 2, 1)) == 0.75
+    assert table.rate("GBP", datetime.date(2026, 2, 1)) == 1.0
+    assert table.rate("EUR", datetime.date(2026, 2, 1)) is None
+
+
+def test_contributions_carry_base_currency_amount(client):
+    _import(client)
+    usd = client.post("/accounts", json={"name": "Brokerage", "currency": "USD"}).json()["id"]
+    yen = client.post("/accounts", json={"name": "Yen", "currency": "JPY"}).json()["id"]
+    created = client.post(
+        "/future_contributions", json={"account_id": usd, "amount": 100.0, "date": "2026-01-01", "recurring": True}
+    ).json()
+    client.post("/future_contributions", json={"account_id": yen, "amount": 5000.0, "date": "2026-01-01", "recurring": True})
+
+    assert created["currency"] == "USD"
+    assert created["base_amount"] == 75.0  # today's rate, as the projection uses
+    listed = {c["account_id"]: c for c in client.get("/future_contributions").json()}
+    assert listed[usd]["amount"] == 100.0
+    assert listed[usd]["base_amount"] == 75.0
+    assert listed[yen]["base_amount"] is None
+
+
+def test_account_currency_is_normalised(client):
+    assert client.post("/accounts", json={"name": "Brokerage", "currency": " usd "}).json()["currency"] == "USD"
+
+
+@pytest.mark.parametrize("currency", ["dollars", "US", "U$D", ""])
+def test_account_currency_must_be_an_iso_code(client, currency):
+    assert client.post("/accounts", json={"name": "Bad", "currency": currency}).status_code == 422
+    assert client.get("/accounts").json() == []
+
+
+def test_account_currency_can_be_changed(client):
+    _import(client)
+    acct = client.post("/accounts", json={"name": "Brokerage"}).json()["id"]
+    client.post("/values", json={"account_id": acct, "value": 100.0, "date": "2026-01-01"})
+    assert client.get("/summary").json()["total"] == 100.0
+
+    updated = client.patch(f"/accounts/{acct}", json={"currency": "usd"}).json()
+    assert updated == {"id": acct, "name": "Brokerage", "currency": "USD"}
+    assert client.get("/summary").json()["total"] == 75.0
+
+    assert client.patch(f"/accounts/{acct}", json={"currency": "dollars"}).status_code == 422
+    assert client.get("/accounts").json()[0]["currency"] == "USD"
@@ -0,0 +1,116 @@
+"""Tests for the nightly maintenance jobs and scheduler."""
+
+import datetime
+
+import pytest
+from sqlmodel import Session, SQLModel, create_engine
+
+import backend.db as db_module
+from backend import analytics, maintenance
+from backend.maintenance import Job, Scheduler
+from backend.models import Account, ValueRecord
+
+
+@pytest.fixture()
+def file_engine(tmp_path, monkeypatch):
+    """A file-backed database (VACUUM and WAL need a real file) patched in as the live engine."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'budget.db'}")
+    SQLModel.metadata.create_all(engine)
+    monkeypatch.setattr(db_module, "engine", engine)
+    return engine
+
+
+@pytest.fixture()
+def sched(monkeypatch):
+    s = Scheduler(datetime.time(3, 30))
+    monkeypatch.setattr("backend.maintenance.scheduler", s)
+    monkeypatch.setattr("backend.routers.maintenance.scheduler", s)
+    return s
+
+
+def _churn(engine, n=2000):
+    """Insert then delete `n` value records, leaving free pages behind."""
+    with Session(engine) as session:
+        acct = Account(name="ISA")
+        session.add(acct)
+        session.commit()
+        for i in range(n):
+            session.add(ValueRecord(account_id=acct.id, value_pence=i, date=datetime.date(2026, 1, 1)))
+        session.commit()
+        session.query(ValueRecord).delete()
+        session.commit()
+
+
+def _pragma(engine, name):
+    with engine.connect() as conn:
+        return conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+
+def test_vacuum_switches_to_incremental_then_frees_pages(file_engine):
+    _churn(file_engine)
+    first = maintenance.vacuum()
+    assert first["full_vacuum"] is True
+    assert _pragma(file_engine, "auto_vacuum") == 2
+    assert _pragma(file_engine, "freelist_count") == 0
+
+    _churn(file_engine)
+    second = maintenance.vacuum()
+    assert second["full_vacuum"] is False
+    assert second["pages_freed"] > 0
+    assert _pragma(file_engine, "freelist_count") == 0
+
+
+def test_checkpoint_is_skipped_outside_wal_mode(file_engine):
+    with pytest.raises(maintenance.JobSkipped):
+        maintenance.checkpoint()
+
+    with file_engine.connect() as conn:
+        conn.exec_driver_sql("PRAGMA journal_mode = WAL")
+    _churn(file_engine, n=100)
+    assert maintenance.checkpoint()["busy"] is False
+
+
+def test_run_all_reports_each_job(client, sched):
+    acct_id = client.post("/accounts", json={"name": "ISA"}).json()["id"]
+    client.post("/values", json={"account_id": acct_id, "value": 10.0, "date": "2026-01-01"})
+    analytics.cache.clear()
+
+    sched.run_all()
+    data = client.get("/maintenance").json()
+
+    assert data["enabled"] is True
+    assert data["at"] == "03:30"
+    status = {job["name"]: job for job in data["jobs"]}
+    assert status["analyze"]["status"] == "ok"
+    assert status["vacuum"]["status"] == "ok"
+    assert status["checkpoint"]["status"] == "skipped"
+    assert status["snapshot"]["status"] == "skipped"
+    assert status["prewarm"]["status"] == "ok"
+    assert status["prewarm"]["detail"]["accounts"] == 1
+    assert all(job["duration_ms"] is not None for job in data["jobs"])
+    # the analytics cache is warm for today
+    assert analytics.cache.get(acct_id, (datetime.date.today(), None)) is not None
+
+
+def test_failed_job_is_reported_and_later_jobs_still_run():
+    def boom():
+        raise RuntimeError("disk full")
+
+    s = Scheduler(None)
+    s.jobs = [Job("boom", boom), Job("after", lambda: {"fine": True})]
+    results = s.run_all()
+
+    assert results[0]["status"] == "error"
+    assert "disk full" in results[0]["detail"]["error"]
+    assert results[1]["status"] == "ok"
+
+
+def test_next_run_is_the_next_occurrence_of_the_configured_time():
+    s = Scheduler(datetime.time(3, 30))
+    assert s.next_after(datetime.datetime(2026, 10, 19, 1, 0)) == datetime.datetime(2026, 10, 19, 3, 30)
+    assert s.next_after(datetime.datetime(2026, 10, 19, 3, 30)) == datetime.datetime(2026, 10, 20, 3, 30)
+
+
+def test_cli_rejects_unknown_jobs(capsys):
+    assert maintenance.main(["defrag"]) == 2
+    assert "defrag" in capsys.readouterr().err
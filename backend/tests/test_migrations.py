@@ -0,0 +1,76 @@
+"""Tests for the legacy-schema upgrade in backend.migrations."""
+
+import datetime
+import sqlite3
+
+import pytest
+from sqlmodel import Session, create_engine, select
+
+from backend.migrations import main, upgrade
+from backend.models import FutureContribution, ValueRecord
+
+
+LEGACY_SCHEMA = """
+CREATE TABLE account (id INTEGER PRIMARY KEY, name VARCHAR NOT NULL);
+CREATE TABLE valuerecord (
+    id INTEGER PRIMARY KEY, account_id INTEGER NOT NULL REFERENCES account (id),
+    value FLOAT NOT NULL, date DATE NOT NULL
+);
+CREATE TABLE futurecontribution (
+    id INTEGER PRIMARY KEY, account_id INTEGER REFERENCES account (id),
+    amount FLOAT NOT NULL, date VARCHAR, recurring BOOLEAN NOT NULL
+);
+CREATE TABLE appsettings (id INTEGER PRIMARY KEY, total_target FLOAT);
+INSERT INTO account VALUES (1, 'Legacy ISA');
+INSERT INTO valuerecord VALUES (1, 1, 0.1, '2026-01-01'), (2, 1, 1234.565, '2026-02-01');
+INSERT INTO futurecontribution VALUES (1, 1, 42.5, '2026-03-01', 0), (2, NULL, 7.0, '', 1);
+"""
+
+
+@pytest.fixture()
+def legacy_db(tmp_path):
+    path = tmp_path / "budget.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(LEGACY_SCHEMA)
+    conn.close()
+    return path
+
+
+def test_upgrade_converts_money_to_pence_and_dates(legacy_db):
+    engine = create_engine(f"sqlite:///{legacy_db}")
+    applied = upgrade(engine)
+    assert applied == ["valuerecord_to_pence", "futurecontribution_to_pence_and_date", "account_currency"]
+
+    with Session(engine) as session:
+        values = session.exec(select(ValueRecord).order_by(ValueRecord.id)).all()
+        assert [v.value_pence for v in values] == [10, 123457]
+        assert values[0].date == datetime.date(2026, 1, 1)
+
+        contribs = session.exec(select(FutureContribution).order_by(FutureContribution.id)).all()
+        assert [c.amount_pence for c in contribs] == [4250, 700]
+        assert contribs[0].date == datetime.date(2026, 3, 1)
+        assert contribs[1].date is None
+        assert contribs[1].recurring is True
+
+
+def test_upgrade_is_idempotent(legacy_db):
+    engine = create_engine(f"sqlite:///{legacy_db}")
+    upgrade(engine)
+    assert upgrade(engine) == []
+
+
+def test_cli_writes_backup(legacy_db, capsys):
+    assert main([str(legacy_db)]) == 0
+    assert legacy_db.with_name("budget.db.bak").exists()
+    assert "applied" in capsys.readouterr().out
+
+
+def test_api_money_round_trip_is_exact(client):
+    """Pounds go in and come out unchanged, and the SQL total doesn't drift."""
+    acct_id = client.post("/accounts", json={"name": "Pence ISA"}).json()["id"]
+    a2 = client.post("/accounts", json={"name": "Other ISA"}).json()["id"]
+    client.post("/values", json={"account_id": acct_id, "value": 0.1, "date": "2026-01-01"})
+    client.post("/values", json={"account_id": a2, "value": 0.2, "date": "2026-01-01"})
+
+    assert client.get("/values").json()[0]["value"] == 0.1
+    assert client.get("/summary").json()["total"] == 0.3
@@ -0,0 +1,114 @@
+"""Tests for the opt-in request profiler and the /debug/profiles endpoints."""
+
+import datetime
+import threading
+
+import pytest
+from sqlmodel import Session
+
+import backend.db as db_module
+from backend import profiling
+from backend.models import Account, ValueRecord
+
+
+@pytest.fixture()
+def profiler(monkeypatch):
+    store = profiling.ProfileStore(enabled=True, keep=2, interval=0.0005)
+    monkeypatch.setattr(profiling, "store", store)
+    return store
+
+
+def test_debug_endpoints_404_when_profiling_disabled(client):
+    assert client.get("/debug/profiles").status_code == 404
+
+
+def test_requests_are_not_profiled_unless_asked(client, profiler):
+    resp = client.get("/summary")
+    assert "X-Profile-Id" not in resp.headers
+    assert client.get("/debug/profiles").json() == []
+
+
+def test_profile_requested_by_header_is_stored_and_downloadable(client, profiler):
+    resp = client.get("/summary", headers={"X-Profile": "1"})
+    assert resp.status_code == 200
+    profile_id = int(resp.headers["X-Profile-Id"])
+
+    listed = client.get("/debug/profiles").json()
+    assert [p["id"] for p in listed] == [profile_id]
+    assert listed[0]["path"] == "/summary"
+    assert listed[0]["status"] == 200
+    assert set(listed[0]["library_share"]) >= {"sqlalchemy", "pydantic"}
+
+    download = client.get(f"/debug/profiles/{profile_id}")
+    assert download.status_code == 200
+    assert "attachment" in download.headers["content-disposition"]
+
+
+def _many_values(n=5000):
+    with Session(db_module.engine) as session:
+        acct = Account(name="ISA")
+        session.add(acct)
+        session.commit()
+        session.add_all(
+            ValueRecord(account_id=acct.id, value_pence=i, date=datetime.date(2026, 1, 1)) for i in range(n)
+        )
+        session.commit()
+
+
+def test_compiled_pydantic_work_is_attributed_to_pydantic(client, profiler):
+    _many_values()
+    resp = client.get("/values?profile=1")
+    profile = profiler.get(int(resp.headers["X-Profile-Id"]))
+
+    assert profile.samples > 0
+    assert profile.library_share()["pydantic"] > 0
+    assert profiling._COMPILED_PYDANTIC in profile.folded()
+
+
+def _busy_elsewhere(stop):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def test_other_threads_are_not_sampled(client, profiler):
+    _many_values(1000)
+    stop = threading.Event()
+    other = threading.Thread(target=_busy_elsewhere, args=(stop,))
+    other.start()
+    try:
+        resp = client.get("/values?profile=1")
+    finally:
+        stop.set()
+        other.join()
+
+    folded = profiler.get(int(resp.headers["X-Profile-Id"])).folded()
+    assert "backend.routers.values:list_values" in folded
+    assert "_busy_elsewhere" not in folded
+
+
+def test_profile_requested_by_query_param(client, profiler):
+    resp = client.get("/accounts?profile=1")
+    assert "X-Profile-Id" in resp.headers
+
+
+def test_ring_buffer_keeps_only_the_latest_profiles(client, profiler):
+    ids = [int(client.get("/accounts", headers={"X-Profile": "1"}).headers["X-Profile-Id"]) for _ in range(3)]
+
+    listed = [p["id"] for p in client.get("/debug/profiles").json()]
+    assert listed == [ids[2], ids[1]]
+    assert client.get(f"/debug/profiles/{ids[0]}").status_code == 404
+
+
+def test_library_share_counts_samples_per_library():
+    p = profiling.Profile(
+        1, "GET", "/x",
+        stacks=profiling.collections.Counter({
+            "backend.routers.summary:summary;sqlalchemy.orm.session:execute": 3,
+            "backend.routers.summary:summary;pydantic.main:validate": 1,
+        }),
+        samples=4, duration=0.01,
+    )
+    share = p.library_share()
+    assert share["sqlalchemy"] == 0.75
+    assert share["pydantic"] == 0.25
+    assert share["backend"] == 1.0
@@ -0,0 +1,105 @@
+"""Tests for the optional in-memory read model (BUDGET_READ_MODEL=1)."""
+
+import pytest
+from sqlalchemy import text
+from sqlmodel import Session
+
+import backend.db as db_module
+from backend import maintenance
+from backend.models import ValueRecord
+from backend.readmodel import read_model
+from backend.snapshot import Snapshot
+
+
+@pytest.fixture()
+def rm_client(client, monkeypatch):
+    """The regular client with the read model enabled and loaded from the test DB."""
+    for attr in ("enabled", "_loaded", "_accounts", "_series", "_owner", "_target"):
+        monkeypatch.setattr(read_model, attr, getattr(read_model, attr))
+    read_model.enabled = True
+    with Session(db_module.engine) as session:
+        read_model.load(session)
+    return client
+
+
+def _populate(c):
+    isa = c.post("/accounts", json={"name": "ISA"}).json()["id"]
+    pension = c.post("/accounts", json={"name": "Pension"}).json()["id"]
+    c.post("/values", json={"account_id": isa, "value": 100.0, "date": "2026-02-01"})
+    c.post("/values", json={"account_id": isa, "value": 50.0, "date": "2026-01-01"})
+    c.post("/values", json={"account_id": pension, "value": 200.0, "date": "2026-01-15"})
+    c.put("/settings", json={"total_target": 1000.0})
+    return isa, pension
+
+
+def test_reads_match_database(rm_client):
+    isa, pension = _populate(rm_client)
+    from_memory = {path: rm_client.get(path).json() for path in ("/summary", "/accounts", "/values")}
+
+    read_model._loaded = False
+    from_db = {path: rm_client.get(path).json() for path in ("/summary", "/accounts", "/values")}
+
+    assert from_memory == from_db
+    assert from_memory["/summary"]["total"] == 300.0
+    assert from_memory["/summary"]["target"] == 1000.0
+    assert [v["date"] for v in from_memory["/values"]] == ["2026-01-01", "2026-01-15", "2026-02-01"]
+
+
+def test_reads_are_served_without_the_database(rm_client):
+    _populate(rm_client)
+    with Session(db_module.engine) as session:
+        session.execute(text("DELETE FROM valuerecord"))
+        session.commit()
+
+    assert rm_client.get("/summary").json()["total"] == 300.0
+    assert len(rm_client.get("/values").json()) == 3
+
+
+def test_deletes_and_renames_are_applied(rm_client):
+    isa, pension = _populate(rm_client)
+    latest = rm_client.get("/values").json()[-1]
+    rm_client.delete(f"/values/{latest['id']}")
+    rm_client.patch(f"/accounts/{isa}", json={"name": "Stocks ISA"})
+    rm_client.delete(f"/accounts/{pension}")
+
+    data = rm_client.get("/summary").json()
+    assert data["total"] == 50.0
+    assert [a["name"] for a in data["accounts"]] == ["Stocks ISA"]
+    assert [v["account_id"] for v in rm_client.get("/values").json()] == [isa]
+
+
+def test_disabled_model_ignores_writes(client):
+    assert not read_model.ready
+    client.post("/accounts", json={"name": "ISA"})
+    assert read_model.accounts() == []
+
+
+def test_in_memory_values_carry_no_snapshot_age(rm_client, tmp_path, monkeypatch):
+    snap = Snapshot(path=str(tmp_path / "budget.db.snapshot"), interval=0, enabled=True)
+    monkeypatch.setattr("backend.snapshot.snapshot", snap)
+    _populate(rm_client)
+    snap.refresh()
+
+    resp = rm_client.get("/values")
+    assert len(resp.json()) == 3
+    assert "X-Snapshot-Age" not in resp.headers
+
+    read_model._loaded = False
+    assert "X-Snapshot-Age" in rm_client.get("/values").headers
+
+
+def test_put_value_ignores_a_record_it_already_has(rm_client):
+    isa, _ = _populate(rm_client)
+    with Session(db_module.engine) as session:
+        record = session.get(ValueRecord, rm_client.get("/values").json()[0]["id"])
+    read_model.put_value(record)
+
+    assert len(rm_client.get("/values").json()) == 3
+    assert rm_client.get("/summary").json()["total"] == 300.0
+
+
+def test_prewarm_leaves_the_read_model_alone(rm_client, monkeypatch):
+    _populate(rm_client)
+    monkeypatch.setattr(read_model, "load", lambda session: pytest.fail("prewarm reloaded the read model"))
+    maintenance.prewarm()
+    assert rm_client.get("/summary").json()["total"] == 300.0
@@ -0,0 +1,66 @@
+"""Tests for the read-only snapshot and snapshot-routed reads."""
+
+import pytest
+
+from backend.snapshot import Snapshot
+
+
+@pytest.fixture()
+def snap(tmp_path, monkeypatch):
+    """Swap in a fresh Snapshot writing to tmp_path, with read routing enabled."""
+    s = Snapshot(path=str(tmp_path / "budget.db.snapshot"), interval=0, enabled=True)
+    monkeypatch.setattr("backend.snapshot.snapshot", s)
+    monkeypatch.setattr("backend.routers.snapshot.snapshot", s)
+    return s
+
+
+def test_snapshot_status_before_first_refresh(client, snap):
+    data = client.get("/snapshot").json()
+    assert data["refreshed_at"] is None
+    assert data["age_seconds"] is None
+
+
+def test_reads_fall_back_to_live_db_until_snapshot_exists(client, snap):
+    acct_id = client.post("/accounts", json={"name": "ISA"}).json()["id"]
+    client.post("/values", json={"account_id": acct_id, "value": 7.0, "date": "2026-01-01"})
+
+    resp = client.get("/values")
+    assert len(resp.json()) == 1
+    assert "X-Snapshot-Age" not in resp.headers
+
+
+def test_history_is_served_from_snapshot_until_refreshed(client, snap):
+    acct_id = client.post("/accounts", json={"name": "ISA"}).json()["id"]
+    client.post("/values", json={"account_id": acct_id, "value": 7.0, "date": "2026-01-01"})
+    snap.refresh()
+
+    client.post("/values", json={"account_id": acct_id, "value": 42.0, "date": "2026-02-01"})
+    resp = client.get("/values")
+    assert [v["value"] for v in resp.json()] == [7.0]
+    assert "X-Snapshot-Age" in resp.headers
+    assert client.get(f"/analytics/{acct_id}").json()["end_value"] == 7.0
+
+    snap.refresh()
+    assert [v["value"] for v in client.get("/values").json()] == [7.0, 42.0]
+    assert client.get(f"/analytics/{acct_id}").json()["end_value"] == 42.0
+
+    status = client.get("/snapshot").json()
+    assert status["generation"] == 2
+    assert status["age_seconds"] >= 0
+
+
+def test_snapshot_file_is_read_only(client, snap):
+    snap.refresh()
+    with snap.session() as session:
+        with pytest.raises(Exception):
+            session.exec("INSERT INTO account (name) VALUES ('nope')")
+            session.commit()
+
+
+def test_snapshot_age_header_is_exposed_to_the_frontend(client, snap):
+    snap.refresh()
+    resp = client.get("/values", headers={"Origin": "http://localhost:5173"})
+    assert "X-Snapshot-Age" in resp.headers
+    exposed = [h.strip().lower() for h in resp.headers["access-control-expose-headers"].split(",")]
+    assert "x-snapshot-age" in exposed
+    assert "x-profile-id" in exposed
@@ -1,6 +1,6 @@
 import React, { useEffect, useState, useMemo } from "react"
 import axios from "axios"
-import { fmt, nextNMonths, monthsToTarget } from "../utils"
+import { currencyLabel, fmt, fmtIn, nextNMonths, monthsToTarget } from "../utils"
 import {
   ResponsiveContainer,
   LineChart,
@@ -17,18 +17,55 @@ const API = `http://${window.location.hostname}:8000`
 type FutureContribution = {
   id: number
   account_id?: number | null
+  // in the account's currency; base_amount is converted into £ (null: no FX rate)
   amount: number
+  currency?: string
+  base_amount?: number | null
   date?: string | null
   recurring: boolean
 }
 
+type Account = { id: number; name: string; currency?: string }
+
+// Projection maths is in the base currency, like the /summary total it starts
+// from. Contributions in a currency without an FX rate are left out, as
+// /summary leaves out such accounts.
+const inBase = (f: FutureContribution) => f.base_amount ?? 0
+
+// GET /forecast/sensitivity: projected balances (£) for every account x
+// monthly-rate delta x horizon. The default surface has a horizon for every
+// month up to 60, so balances[h] is the balance after h + 1 months.
+type Surface = {
+  horizons: number[]
+  deltas: number[]
+  baseline: { monthly_rate: number; balances: number[] }
+  accounts: { id: number; monthly_rate: number; balances: number[][] }[]
+}
+
+/** Index of the grid delta nearest to `delta`, clamped to the ends of the grid. */
+function nearestDelta(deltas: number[], delta: number): number {
+  const step = deltas[1] - deltas[0]
+  const i = Math.round((delta - deltas[0]) / step)
+  return Math.min(deltas.length - 1, Math.max(0, i))
+}
+
+/** Months until `path` (balance after month 1, 2, …) reaches target, extended at `rate` past its end. */
+function monthsAlong(path: number[], start: number, target: number | null, rate: number): number | null {
+  if (!target || start >= target) return null
+  const hit = path.findIndex((b) => b >= target)
+  if (hit >= 0) return hit + 1
+  const beyond = monthsToTarget(path[path.length - 1] ?? start, target, rate)
+  return beyond === null ? null : path.length + beyond
+}
+
 type Notice = { type: "success" | "error"; msg: string }
 
 export default function Forecast() {
   const [futureContributions, setFutureContributions] = useState<FutureContribution[]>([])
-  const [accounts, setAccounts] = useState<{ id: number; name: string }[]>([])
+  const [accounts, setAccounts] = useState<Account[]>([])
   const [summaryTotal, setSummaryTotal] = useState<number>(0)
   const [target, setTarget] = useState<number | null>(null)
+  const [surface, setSurface] = useState<Surface | null>(null)
   const [loading, setLoading] = useState(true)
   const [notice, setNotice] = useState<Notice | null>(null)
 
@@ -42,7 +79,7 @@ export default function Forecast() {
     new Date().toISOString().slice(0, 10)
   )
 
-  // Per-account what-if monthly amounts (absolute £ values)
+  // Per-account what-if monthly amounts (absolute £ values, as typed)
   const [whatIfAmounts, setWhatIfAmounts] = useState<Record<number, string>>({})
 
   // Forecast timeframe
@@ -54,15 +91,17 @@ export default function Forecast() {
   }
 
   async function loadAll() {
-    const [fcRes, acctRes, sumRes] = await Promise.all([
+    const [fcRes, acctRes, sumRes, surfRes] = await Promise.all([
       axios.get(`${API}/future_contributions`),
       axios.get(`${API}/accounts`),
       axios.get(`${API}/summary`),
+      axios.get(`${API}/forecast/sensitivity`),
     ])
     setFutureContributions(fcRes.data)
     setAccounts(acctRes.data)
     setSummaryTotal(sumRes.data.total ?? 0)
     setTarget(sumRes.data.target ?? null)
+    setSurface(surfRes.data)
     if (!oneOffAccount && acctRes.data.length) {
       setOneOffAccount(String(acctRes.data[0].id))
     }
@@ -143,53 +182,59 @@ export default function Forecast() {
   const perAccountRate = accounts.map((a) => {
     const rate = futureContributions
       .filter((f) => f.recurring && f.account_id === a.id)
-      .reduce((s, f) => s + f.amount, 0)
+      .reduce((s, f) => s + inBase(f), 0)
     return { ...a, rate }
   })
 
-  const { projectionData, totalRecurring, totalAdjusted, hasWhatIf } = useMemo(() => {
-    const recurring = futureContributions.filter((f) => f.recurring)
-    const oneOffs = futureContributions.filter((f) => !f.recurring && f.date)
-
-    const totalRecurring = recurring.reduce((s, f) => s + f.amount, 0)
-
-    // Per-account adjusted monthly total: use whatIfAmounts[id] if set, else current rate
-    const totalAdjusted = accounts.reduce((sum, a) => {
-      const raw = whatIfAmounts[a.id]
-      const adj = raw !== undefined && raw !== "" ? parseFloat(raw) : perAccountRate.find((p) => p.id === a.id)?.rate ?? 0
-      return sum + (isNaN(adj) ? 0 : adj)
-    }, 0)
-    const hasWhatIf = totalAdjusted !== totalRecurring
-
-    // Build one-off map: "YYYY-M" → total amount that month
-    const oneOffMap: Record<string, number> = {}
-    oneOffs.forEach((f) => {
-      const d = new Date(f.date as string)
-      const key = `${d.getFullYear()}-${d.getMonth()}`
-      oneOffMap[key] = (oneOffMap[key] || 0) + f.amount
+  // What-if amounts snap to the nearest delta on the surface's grid around
+  // each account's current rate, so a keystroke is a lookup rather than a new
+  // projection. Rates can't go below zero: the surface clamps those deltas.
+  const whatIfDelta = useMemo(() => {
+    const picked: Record<number, { index: number; delta: number }> = {}
+    if (!surface) return picked
+    surface.accounts.forEach((s) => {
+      const raw = whatIfAmounts[s.id]
+      const val = raw !== undefined && raw !== "" ? parseFloat(raw) : NaN
+      if (isNaN(val)) return
+      const index = nearestDelta(surface.deltas, val - s.monthly_rate)
+      picked[s.id] = { index, delta: Math.max(surface.deltas[index], -s.monthly_rate) }
     })
-
-    const months = nextNMonths(forecastMonths)
-    let runningBase = summaryTotal
-    let runningAdjusted = summaryTotal
-
-    const data = months.map(({ label, year, month }) => {
-      const oneOff = oneOffMap[`${year}-${month}`] || 0
-      runningBase += totalRecurring + oneOff
-      runningAdjusted += totalAdjusted + oneOff
-      return {
-        name: label,
-        "Current Rate": Math.round(runningBase),
-        Adjusted: Math.round(runningAdjusted),
-      }
+    return picked
+  }, [surface, whatIfAmounts])
+
+  const { projectionData, totalRecurring, totalAdjusted, hasWhatIf, mttBase, mttAdj } = useMemo(() => {
+    const base = surface?.baseline.balances ?? []
+    const totalRecurring = surface?.baseline.monthly_rate ?? 0
+    let adjusted = base
+    let totalAdjusted = totalRecurring
+    surface?.accounts.forEach((s) => {
+      const pick = whatIfDelta[s.id]
+      if (!pick || pick.delta === 0) return
+      // the projection is linear, so each account's change adds onto the baseline
+      const row = s.balances[pick.index]
+      adjusted = adjusted.map((b, h) => b + row[h] - base[h])
+      totalAdjusted += pick.delta
     })
 
-    return { projectionData: data, totalRecurring, totalAdjusted, hasWhatIf }
-  }, [futureContributions, summaryTotal, whatIfAmounts, accounts, perAccountRate, forecastMonths])
+    const data = nextNMonths(Math.min(forecastMonths, base.length)).map(({ label }, i) => ({
+      name: label,
+      "Current Rate": Math.round(base[i]),
+      Adjusted: Math.round(adjusted[i]),
+    }))
+
+    return {
+      projectionData: data,
+      totalRecurring,
+      totalAdjusted,
+      hasWhatIf: adjusted !== base,
+      mttBase: monthsAlong(base, summaryTotal, target, totalRecurring),
+      mttAdj: monthsAlong(adjusted, summaryTotal, target, totalAdjusted),
+    }
+  }, [surface, whatIfDelta, summaryTotal, target, forecastMonths])
 
   const oneOffList = futureContributions.filter((f) => !f.recurring)
-  const mttBase = monthsToTarget(summaryTotal, target, totalRecurring)
-  const mttAdj = monthsToTarget(summaryTotal, target, totalAdjusted)
+  const gridStep = surface && surface.deltas.length > 1 ? surface.deltas[1] - surface.deltas[0] : 0
+  const gridMax = surface ? surface.deltas[surface.deltas.length - 1] : 0
 
   if (loading) {
     return (
@@ -241,7 +286,7 @@ export default function Forecast() {
                 {a.name}
               </div>
               <label className="form-field">
-                <span>£ / month</span>
+                <span>{currencyLabel(a.currency)} / month</span>
                 <input
                   type="number"
                   step="0.01"
@@ -288,7 +333,9 @@ export default function Forecast() {
             </select>
           </label>
           <label className="form-field">
-            <span>Amount (£)</span>
+            <span>
+              Amount ({currencyLabel(accounts.find((a) => String(a.id) === oneOffAccount)?.currency)})
+            </span>
             <input
               type="number"
               step="0.01"
@@ -336,7 +383,7 @@ export default function Forecast() {
                 return (
                   <div key={f.id} className="contribution-row">
                     <div>
-                      <div style={{ fontWeight: 500 }}>{fmt(f.amount)}</div>
+                      <div style={{ fontWeight: 500 }}>{fmtIn(f.amount, f.currency)}</div>
                       <div className="contribution-meta">
                         {f.date} · {acct?.name ?? "Unallocated"}
                       </div>
@@ -360,14 +407,25 @@ export default function Forecast() {
         <h3>What-if Adjustment</h3>
         <p style={{ color: "var(--muted)", margin: "0 0 14px", fontSize: 13 }}>
           Override any account's monthly contribution to see how a change would
-          impact your forecast. Leave blank to keep the current rate.
+          impact your forecast. Leave blank to keep the current rate. Changes
+          are rounded to the nearest {fmt(gridStep)} and capped at ±{fmt(gridMax)}/mo.
         </p>
         <div style={{ display: "flex", flexDirection: "column", gap: 10 }}>
           {accounts.map((a) => {
-            const current = perAccountRate.find((p) => p.id === a.id)?.rate ?? 0
+            const projected = surface?.accounts.find((s) => s.id === a.id)
+            if (!projected) {
+              return (
+                <div key={a.id} className="form-row" style={{ flexWrap: "nowrap", alignItems: "center" }}>
+                  <div style={{ width: 170, fontWeight: 500, fontSize: 14 }}>{a.name}</div>
+                  <div style={{ color: "var(--muted)", fontSize: 13 }}>
+                    No {a.currency} rate, left out of the forecast
+                  </div>
+                </div>
+              )
+            }
+            const current = projected.monthly_rate
             const raw = whatIfAmounts[a.id]
-            const whatIfVal = raw !== undefined && raw !== "" ? parseFloat(raw) : current
-            const diff = (isNaN(whatIfVal) ? 0 : whatIfVal) - current
+            const diff = whatIfDelta[a.id]?.delta ?? 0
             return (
               <div key={a.id} className="form-row" style={{ flexWrap: "nowrap", alignItems: "center" }}>
                 <div style={{ width: 170, fontWeight: 500, fontSize: 14 }}>{a.name}</div>
@@ -388,7 +446,7 @@ export default function Forecast() {
                     style={{ width: 120 }}
                   />
                 </label>
-                {raw !== undefined && raw !== "" && !isNaN(parseFloat(raw)) && (
+                {whatIfDelta[a.id] && (
                   <div
                     style={{
                       fontSize: 13,
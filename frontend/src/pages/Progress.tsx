@@ -1,6 +1,6 @@
 import React, { useEffect, useState, useMemo } from "react"
 import axios from "axios"
-import { fmt, monthsFromTo } from "../utils"
+import { fmt, fmtIn, monthsFromTo } from "../utils"
 import {
   ResponsiveContainer,
   BarChart,
@@ -17,14 +17,35 @@ import {
 const API = `http://${window.location.hostname}:8000`
 const ACCOUNT_COLORS = ["#3b82f6", "#10b981", "#f59e0b", "#8b5cf6", "#ec4899"]
 
-type Account = { id: number; name: string; total?: number }
-type ValueRecord = { id: number; account_id: number; value: number; date: string }
+// `total` is converted into £; it is null when the account's currency has no
+// FX rate yet, and the account is then left out of the overall total
+type Account = {
+  id: number
+  name: string
+  currency?: string
+  native_total?: number
+  total?: number | null
+}
+// `value` is in the account's currency; base_value is converted into £ at that
+// date's FX rate (null when there is no rate, like /summary's `total`)
+type ValueRecord = {
+  id: number
+  account_id: number
+  value: number
+  date: string
+  currency?: string
+  base_value?: number | null
+}
+
+const inBase = (v: ValueRecord) => v.base_value ?? 0
+
 
 type Notice = { type: "success" | "error"; msg: string }
 
 export default function Progress() {
   const [accounts, setAccounts] = useState<Account[]>([])
   const [total, setTotal] = useState<number>(0)
+  const [missingRates, setMissingRates] = useState<string[]>([])
   const [target, setTarget] = useState<number | null>(null)
   const [targetInput, setTargetInput] = useState<string>("")
   const [values, setValues] = useState<ValueRecord[]>([])
@@ -48,6 +69,7 @@ export default function Progress() {
       axios.get(`${API}/values`),
     ])
     setTotal(sumRes.data.total ?? 0)
+    setMissingRates(sumRes.data.missing_rates ?? [])
     setTarget(sumRes.data.target ?? null)
     setTargetInput(String(sumRes.data.target ?? ""))
     if (sumRes.data.accounts) {
@@ -140,7 +162,7 @@ export default function Progress() {
         const recs = sorted.filter(
           (v) => v.account_id === a.id && new Date(v.date) <= monthEnd
         )
-        obj[a.name] = recs.length ? recs[recs.length - 1].value : 0
+        obj[a.name] = recs.length ? inBase(recs[recs.length - 1]) : 0
       })
       return obj
     })
@@ -166,8 +188,10 @@ export default function Progress() {
       const latest = recs[recs.length - 1]
       // last record on or before 30 days ago
       const prev = [...recs].reverse().find((r) => new Date(r.date) <= cutoff)
-      const change = (latest?.value ?? 0) - (prev?.value ?? latest?.value ?? 0)
-      const pct = prev && prev.value ? (change / prev.value) * 100 : null
+      const latestBase = latest ? inBase(latest) : 0
+      const prevBase = prev ? inBase(prev) : latestBase
+      const change = latestBase - prevBase
+      const pct = prev && prevBase ? (change / prevBase) * 100 : null
       return { account: a, change, pct }
     })
   }, [accounts, values])
@@ -200,18 +224,31 @@ export default function Progress() {
           {target && (
             <div className="stat-sub">{pct.toFixed(1)}% of target</div>
           )}
+          {missingRates.length > 0 && (
+            <div className="stat-sub">
+              Excludes {missingRates.join(", ")} accounts (no FX rate)
+            </div>
+          )}
         </div>
-        {accounts.map((a, i) => (
-          <div key={a.id} className="stat-card">
-            <div className="stat-label">{a.name}</div>
-            <div className="stat-value">{fmt(a.total ?? 0)}</div>
-            {total > 0 && (
-              <div className="stat-sub">
-                {(((a.total ?? 0) / total) * 100).toFixed(1)}% of total
-              </div>
-            )}
-          </div>
-        ))}
+        {accounts.map((a, i) =>
+          a.total == null ? (
+            <div key={a.id} className="stat-card">
+              <div className="stat-label">{a.name}</div>
+              <div className="stat-value">{fmtIn(a.native_total ?? 0, a.currency)}</div>
+              <div className="stat-sub">No {a.currency} rate, not in total</div>
+            </div>
+          ) : (
+            <div key={a.id} className="stat-card">
+              <div className="stat-label">{a.name}</div>
+              <div className="stat-value">{fmt(a.total)}</div>
+              {total > 0 && (
+                <div className="stat-sub">
+                  {((a.total / total) * 100).toFixed(1)}% of total
+                </div>
+              )}
+            </div>
+          )
+        )}
       </div>
 
       {/* ── Progress toward target ── */}
@@ -443,7 +480,7 @@ export default function Progress() {
                   <tr key={v.id}>
                     <td>{acct?.name ?? `Account ${v.account_id}`}</td>
                     <td>{v.date}</td>
-                    <td>{fmt(v.value)}</td>
+                    <td>{fmtIn(v.value, v.currency)}</td>
                     <td>
                       <button
                         className="btn-danger-sm"
@@ -1,10 +1,17 @@
 import React, { useEffect, useState, useMemo } from "react"
 import axios from "axios"
-import { fmt } from "../utils"
+import { currencyLabel, fmt, fmtIn } from "../utils"
 
 const API = `http://${window.location.hostname}:8000`
 
-type Account = { id: number; name: string; total?: number }
+// `total` is in £ and null when the account's currency has no FX rate yet
+type Account = {
+  id: number
+  name: string
+  currency?: string
+  native_total?: number
+  total?: number | null
+}
 type ValueRecord = { id: number; account_id: number; value: number; date: string }
 type Notice = { type: "success" | "error"; msg: string }
 
@@ -16,14 +23,16 @@ export default function Settings() {
   const [loading, setLoading] = useState(true)
   const [notice, setNotice] = useState<Notice | null>(null)
 
-  // Rename state: accountId → draft name
+  // Rename state: accountId → draft name / currency
   const [renameMap, setRenameMap] = useState<Record<number, string>>({})
+  const [currencyMap, setCurrencyMap] = useState<Record<number, string>>({})
 
   // Opening balance form state per account: accountId → { amount, date }
   const [openingForm, setOpeningForm] = useState<Record<number, { amount: string; date: string }>>({})
 
   // Add account form
   const [newName, setNewName] = useState("")
+  const [newCurrency, setNewCurrency] = useState("GBP")
   const [newAmount, setNewAmount] = useState("")
   const [newDate, setNewDate] = useState(new Date().toISOString().slice(0, 10))
 
@@ -46,8 +55,13 @@ export default function Settings() {
 
     // Initialise rename map from current names
     const rm: Record<number, string> = {}
-    accts.forEach((a) => (rm[a.id] = a.name))
+    const cm: Record<number, string> = {}
+    accts.forEach((a) => {
+      rm[a.id] = a.name
+      cm[a.id] = a.currency ?? "GBP"
+    })
     setRenameMap(rm)
+    setCurrencyMap(cm)
   }
 
   useEffect(() => {
@@ -68,13 +82,15 @@ export default function Settings() {
 
   async function saveRename(accountId: number) {
     const name = (renameMap[accountId] ?? "").trim()
+    const currency = (currencyMap[accountId] ?? "").trim()
     if (!name) { notify("error", "Name cannot be blank"); return }
+    if (!currency) { notify("error", "Currency cannot be blank"); return }
     try {
-      await axios.patch(`${API}/accounts/${accountId}`, { name })
+      await axios.patch(`${API}/accounts/${accountId}`, { name, currency })
       await loadAll()
-      notify("success", "Account renamed")
+      notify("success", "Account updated")
     } catch {
-      notify("error", "Failed to rename account")
+      notify("error", "Failed to update account (is the currency a 3-letter code?)")
     }
   }
 
@@ -126,7 +142,7 @@ export default function Settings() {
     const name = newName.trim()
     if (!name) { notify("error", "Enter an account name"); return }
     try {
-      const acct = (await axios.post(`${API}/accounts`, { name })).data
+      const acct = (await axios.post(`${API}/accounts`, { name, currency: newCurrency.trim() || "GBP" })).data
       if (newAmount && parseFloat(newAmount) > 0) {
         await axios.post(`${API}/values`, {
           account_id: acct.id,
@@ -135,6 +151,7 @@ export default function Settings() {
         })
       }
       setNewName("")
+      setNewCurrency("GBP")
       setNewAmount("")
       setNewDate(new Date().toISOString().slice(0, 10))
       await loadAll()
@@ -196,7 +213,18 @@ export default function Settings() {
             />
           </label>
           <label className="form-field">
-            <span>Opening balance (£)</span>
+            <span>Currency</span>
+            <input
+              type="text"
+              value={newCurrency}
+              onChange={(e) => setNewCurrency(e.target.value.toUpperCase())}
+              placeholder="GBP"
+              maxLength={3}
+              style={{ width: 70 }}
+            />
+          </label>
+          <label className="form-field">
+            <span>Opening balance ({currencyLabel(newCurrency)})</span>
             <input
               type="number"
               step="0.01"
@@ -253,13 +281,25 @@ export default function Settings() {
                         }
                       />
                     </label>
+                    <label className="form-field">
+                      <span>Currency</span>
+                      <input
+                        type="text"
+                        value={currencyMap[a.id] ?? a.currency ?? "GBP"}
+                        onChange={(e) =>
+                          setCurrencyMap({ ...currencyMap, [a.id]: e.target.value.toUpperCase() })
+                        }
+                        maxLength={3}
+                        style={{ width: 70 }}
+                      />
+                    </label>
                     <div className="form-field form-submit">
                       <button
                         type="button"
                         className="btn-primary"
                         onClick={() => saveRename(a.id)}
                       >
-                        Rename
+                        Update
                       </button>
                     </div>
                     <div className="form-field form-submit">
@@ -286,12 +326,13 @@ export default function Settings() {
                   >
                     <span>
                       <strong style={{ color: "var(--text)" }}>Latest:</strong>{" "}
-                      {fmt(a.total ?? 0)}
+                      {fmtIn(a.native_total ?? a.total ?? 0, a.currency)}
+                      {a.total == null && ` (no ${a.currency} rate)`}
                     </span>
                     {opening && (
                       <span>
                         <strong style={{ color: "var(--text)" }}>Opening:</strong>{" "}
-                        {fmt(opening.value)} on {opening.date}
+                        {fmtIn(opening.value, a.currency)} on {opening.date}
                       </span>
                     )}
                   </div>
@@ -312,7 +353,7 @@ export default function Settings() {
                     </div>
                     <div className="form-row" style={{ flexWrap: "nowrap" }}>
                       <label className="form-field">
-                        <span>Amount (£)</span>
+                        <span>Amount ({currencyLabel(a.currency)})</span>
                         <input
                           type="number"
                           step="0.01"
@@ -18,19 +18,40 @@ vi.mock("axios", () => ({
 // ── Shared test data ──────────────────────────────────────────────────────────
 
 const mockAccounts = [
-  { id: 1, name: "ISA Alpha" },
-  { id: 2, name: "ISA Beta" },
+  { id: 1, name: "ISA Alpha", currency: "GBP" },
+  { id: 2, name: "ISA Beta", currency: "GBP" },
 ]
 
 const mockContributions = [
-  { id: 1, account_id: 1, amount: 13, date: "2026-01-01", recurring: true },
-  { id: 2, account_id: 1, amount: 69, date: "2026-04-01", recurring: false },
+  { id: 1, account_id: 1, amount: 13, currency: "GBP", base_amount: 13, date: "2026-01-01", recurring: true },
+  { id: 2, account_id: 1, amount: 69, currency: "GBP", base_amount: 69, date: "2026-04-01", recurring: false },
 ]
 
 const mockSummary = { total: 49, target: 420 }
 
+// A /forecast/sensitivity response for `rates` (£/mo per account id), shaped
+// like the backend's default surface: a £25 grid out to ±£500 and a horizon
+// for every month up to 60. One-offs are left out for simplicity.
+function mockSurface(rates: Record<number, number>, start = mockSummary.total) {
+  const horizons = Array.from({ length: 60 }, (_, i) => i + 1)
+  const deltas = Array.from({ length: 41 }, (_, i) => (i - 20) * 25)
+  const total = Object.values(rates).reduce((s, r) => s + r, 0)
+  return {
+    horizons,
+    deltas,
+    baseline: { monthly_rate: total, balances: horizons.map((h) => start + total * h) },
+    accounts: Object.entries(rates).map(([id, rate]) => ({
+      id: Number(id),
+      monthly_rate: rate,
+      balances: deltas.map((d) => horizons.map((h) => start + (total + Math.max(d, -rate)) * h)),
+    })),
+  }
+}
+
 function setupAxiosMocks() {
   vi.mocked(axios.get).mockImplementation((url: string) => {
+    if (url.includes("/forecast/sensitivity"))
+      return Promise.resolve({ data: mockSurface({ 1: 13, 2: 0 }) })
     if (url.includes("/future_contributions"))
       return Promise.resolve({ data: mockContributions })
     if (url.includes("/accounts"))
@@ -79,6 +100,38 @@ describe("Forecast page", () => {
     expect(screen.getByText("£0/mo")).toBeInTheDocument()
   })
 
+  it("projects contributions in other currencies at their converted amount", async () => {
+    vi.mocked(axios.get).mockImplementation((url: string) => {
+      if (url.includes("/forecast/sensitivity"))
+        return Promise.resolve({ data: mockSurface({ 3: 80 }) })
+      if (url.includes("/future_contributions"))
+        return Promise.resolve({
+          data: [
+            { id: 1, account_id: 3, amount: 100, currency: "USD", base_amount: 80, date: "2026-01-01", recurring: true },
+            // no FX rate for JPY: left out of the projection, like /summary
+            { id: 2, account_id: 4, amount: 5000, currency: "JPY", base_amount: null, date: "2026-01-01", recurring: true },
+          ],
+        })
+      if (url.includes("/accounts"))
+        return Promise.resolve({
+          data: [
+            { id: 3, name: "Brokerage", currency: "USD" },
+            { id: 4, name: "Yen", currency: "JPY" },
+          ],
+        })
+      if (url.includes("/summary"))
+        return Promise.resolve({ data: mockSummary })
+      return Promise.reject(new Error(`Unexpected: ${url}`))
+    })
+    render(<Forecast />)
+    await screen.findByText("Monthly Contribution Rates")
+    // $100/mo is projected as the converted £80, not as £100
+    expect(screen.getAllByText("£80/mo").length).toBeGreaterThan(0)
+    expect(screen.queryByText("£100/mo")).not.toBeInTheDocument()
+    expect(screen.getByText("USD / month")).toBeInTheDocument()
+    expect(screen.getByText(/No JPY rate, left out of the forecast/)).toBeInTheDocument()
+  })
+
   it("lists planned one-off contributions with amount and date", async () => {
     render(<Forecast />)
     await screen.findByText(/Planned one-offs/i)
@@ -88,10 +141,12 @@ describe("Forecast page", () => {
 
   it("does not render the one-off list when there are no one-offs", async () => {
     vi.mocked(axios.get).mockImplementation((url: string) => {
+      if (url.includes("/forecast/sensitivity"))
+        return Promise.resolve({ data: mockSurface({ 1: 42, 2: 0 }) })
       if (url.includes("/future_contributions"))
         // only recurring, no one-offs
         return Promise.resolve({
-          data: [{ id: 1, account_id: 1, amount: 42, date: "2026-01-01", recurring: true }],
+          data: [{ id: 1, account_id: 1, amount: 42, currency: "GBP", base_amount: 42, date: "2026-01-01", recurring: true }],
         })
       if (url.includes("/accounts"))
         return Promise.resolve({ data: mockAccounts })
@@ -104,6 +159,27 @@ describe("Forecast page", () => {
     expect(screen.queryByText(/Planned one-offs/i)).not.toBeInTheDocument()
   })
 
+  // ── What-if ────────────────────────────────────────────────────────────────
+
+  it("reads what-if projections from the sensitivity surface, snapped to its grid", async () => {
+    const user = userEvent.setup()
+    render(<Forecast />)
+    await screen.findByText("What-if Adjustment")
+    expect(vi.mocked(axios.get)).toHaveBeenCalledWith(expect.stringContaining("/forecast/sensitivity"))
+    const loads = vi.mocked(axios.get).mock.calls.length
+
+    // ISA Alpha pays £13/mo; £40 is a +£27 change, which snaps to +£25
+    await user.type(screen.getByPlaceholderText("13"), "40")
+
+    expect(screen.getByText("+£25/mo")).toBeInTheDocument()
+    expect(screen.getAllByText("£38/mo").length).toBeGreaterThan(0)
+    // (420 - 49) / 38 → 10 months, against (420 - 49) / 13 → 29 at the current rate
+    expect(screen.getByText("10 months")).toBeInTheDocument()
+    expect(screen.getByText("29 months")).toBeInTheDocument()
+    // typing is a lookup into the loaded surface, not a new request
+    expect(vi.mocked(axios.get).mock.calls.length).toBe(loads)
+  })
+
   // ── Save recurring contribution ────────────────────────────────────────────
 
   it("calls POST /future_contributions with recurring=true when Save is clicked", async () => {
@@ -18,13 +18,13 @@ vi.mock("axios", () => ({
 // ── Shared test data ──────────────────────────────────────────────────────────
 
 const mockAccounts = [
-  { id: 1, name: "ISA Alpha", total: 42 },
-  { id: 2, name: "ISA Beta", total: 7 },
+  { id: 1, name: "ISA Alpha", currency: "GBP", native_total: 42, total: 42 },
+  { id: 2, name: "ISA Beta", currency: "GBP", native_total: 7, total: 7 },
 ]
 
 const mockValues = [
-  { id: 1, account_id: 1, value: 42, date: "2026-01-01" },
-  { id: 2, account_id: 2, value: 7, date: "2026-01-01" },
+  { id: 1, account_id: 1, value: 42, currency: "GBP", base_value: 42, date: "2026-01-01" },
+  { id: 2, account_id: 2, value: 7, currency: "GBP", base_value: 7, date: "2026-01-01" },
 ]
 
 const mockSummary = {
@@ -75,6 +75,30 @@ describe("Progress page", () => {
     expect(screen.getAllByText("£7").length).toBeGreaterThan(0)
   })
 
+  it("shows an account without an FX rate in its own currency, not as £0", async () => {
+    vi.mocked(axios.get).mockImplementation((url: string) => {
+      if (url.includes("/summary"))
+        return Promise.resolve({
+          data: {
+            total: 42,
+            target: null,
+            accounts: [
+              mockAccounts[0],
+              { id: 3, name: "Yen Savings", currency: "JPY", native_total: 5000, total: null },
+            ],
+            missing_rates: ["JPY"],
+          },
+        })
+      if (url.includes("/values")) return Promise.resolve({ data: [] })
+      return Promise.reject(new Error(`Unexpected: ${url}`))
+    })
+    render(<Progress />)
+    await screen.findByText("5,000 JPY")
+    expect(screen.getByText(/No JPY rate/)).toBeInTheDocument()
+    expect(screen.getByText(/Excludes JPY accounts/)).toBeInTheDocument()
+    expect(screen.queryByText("£0")).not.toBeInTheDocument()
+  })
+
   it("shows progress bar section when a target is set", async () => {
     render(<Progress />)
     await screen.findByText(/Progress to Target/i)
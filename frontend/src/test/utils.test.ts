@@ -1,5 +1,5 @@
 import { describe, it, expect } from "vitest"
-import { fmt, nextNMonths, monthsToTarget, monthsFromTo } from "../utils"
+import { fmt, fmtIn, nextNMonths, monthsToTarget, monthsFromTo } from "../utils"
 
 // ── fmt ──────────────────────────────────────────────────────────────────────
 
@@ -28,6 +28,19 @@ describe("fmt", () => {
   })
 })
 
+// ── fmtIn ────────────────────────────────────────────────────────────────────
+
+describe("fmtIn", () => {
+  it("uses £ for GBP and for an unknown currency", () => {
+    expect(fmtIn(1000, "GBP")).toBe("£1,000")
+    expect(fmtIn(1000)).toBe("£1,000")
+  })
+
+  it("suffixes the ISO code for other currencies", () => {
+    expect(fmtIn(1234.6, "USD")).toBe("1,235 USD")
+  })
+})
+
 // ── nextNMonths ───────────────────────────────────────────────────────────────
 
 describe("nextNMonths", () => {
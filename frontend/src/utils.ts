@@ -8,6 +8,17 @@ export function fmt(n: number): string {
   return "£" + Math.round(n).toLocaleString()
 }
 
+/** Label for an account's currency in inputs: "£" for GBP (or unknown), else the ISO code. */
+export function currencyLabel(currency?: string | null): string {
+  return !currency || currency === "GBP" ? "£" : currency
+}
+
+/** Format an amount in an account's own currency, e.g. £1,234 or 1,234 USD */
+export function fmtIn(n: number, currency?: string | null): string {
+  const label = currencyLabel(currency)
+  return label === "£" ? fmt(n) : `${Math.round(n).toLocaleString()} ${label}`
+}
+
 /** Build N monthly descriptor objects starting from `fromDate` (defaults to today). */
 export function nextNMonths(
   n: number,